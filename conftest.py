@@ -1,11 +1,29 @@
-import allure
 import pytest
-import os
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from utils.lazy import By
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils import driver_factory
+from utils.driver_cache import CACHE_DIR, DriverCache
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.waits import wait_for_presence
+
+pytest_plugins = [
+    "plugins.sleep_report",
+    "plugins.duration_history",
+    "plugins.browser_affinity",
+    "plugins.action_timings",
+    "plugins.page_metrics",
+    "plugins.screenshots",
+    "plugins.allure_compact",
+    "plugins.retry_report",
+    "plugins.impact_map",
+    "plugins.shared_browser",
+    "plugins.matrix",
+    "plugins.startup",
+    "plugins.visual",
+    "plugins.element_cache",
+]
 
 
 def pytest_addoption(parser):
@@ -15,84 +33,119 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser: chrome, chromium, or firefox"
     )
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="Keep warm browsers per worker and reset them between tests"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Idle browsers kept per browser type with --reuse-browser"
+    )
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Headless, eager page loads, no images/fonts/analytics (tests marked needs_images opt out)"
+    )
+    parser.addoption(
+        "--driver-cache",
+        action="store",
+        nargs="?",
+        const=CACHE_DIR,
+        default=None,
+        metavar="DIR",
+        help=f"Resolve drivers/browsers once per machine and launch from template profiles (default {CACHE_DIR})"
+    )
+    parser.addoption(
+        "--base-url",
+        action="store",
+        default=BasePage.base_url,
+        help="Site under test, used by every page object"
+    )
+    parser.addoption(
+        "--local-server",
+        action="store_true",
+        default=False,
+        help="Start the bundled SauceDemo stand-in on loopback and test against it"
+    )
 
 
-@pytest.fixture
-def driver(request):
-    browser = getattr(request, "param", request.config.getoption("--browser"))
-
-    is_ci = bool(os.getenv("CI") or os.getenv("GITHUB_ACTIONS"))
-    print(f"\n Starting {browser.upper()} browser (CI: {is_ci})")
-
-    if browser.lower() == "firefox":
-        options = FirefoxOptions()
-        options.set_preference("dom.disable_beforeunload", True)
-        options.set_preference("dom.disable_open_during_load", False)
+def pytest_configure(config):
+    if config.getoption("--driver-cache"):
+        driver_factory.driver_cache = DriverCache(config.getoption("--driver-cache"))
 
-        if is_ci:
-            options.add_argument("--headless")
+    if config.getoption("--local-server"):
+        from standin.server import StandinServer
+        config.standin_server = StandinServer().start()
+        BasePage.base_url = config.standin_server.url
+    else:
+        base_url = config.getoption("--base-url")
+        BasePage.base_url = base_url if base_url.endswith("/") else base_url + "/"
 
-        driver = webdriver.Firefox(options=options)
 
-    else:
-        options = ChromeOptions()
+def pytest_unconfigure(config):
+    server = getattr(config, "standin_server", None)
+    if server:
+        server.stop()
 
-        # Basic settings
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--window-size=1920,1080")
 
-        # CI-only settings (Chromium)
-        if is_ci:
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    pool = DriverPool(create_driver, BasePage.base_url, size=request.config.getoption("--pool-size"))
+    yield pool
+    print(f"\n Driver pool: {pool.launches} launches, {pool.reuses} reuses")
+    pool.close()
 
-            #  Set Chromium binary location
-            options.binary_location = "/usr/bin/chromium-browser"
 
-            #  Use Service instead of executable_path
-            service = ChromeService(executable_path="/usr/lib/chromium-browser/chromedriver")
-            driver = webdriver.Chrome(service=service, options=options)
+@pytest.fixture
+def driver(request):
+    # Imported here, after pytest_plugins registered (and assert-rewrote) the plugins
+    from plugins.action_timings import instrument
+    from plugins.shared_browser import shared_context, use_shared_browser
 
+    browser = getattr(request, "param", request.config.getoption("--browser"))
+    fast = request.config.getoption("--fast") and not request.node.get_closest_marker("needs_images")
+
+    if use_shared_browser(request.config, browser):
+        # Not instrumented (EventFiringWebDriver needs a real WebDriver); a crash drops
+        # the shared browser in shared_context's finalizer, see plugins/shared_browser.py
+        driver = shared_context(request, fast)
+        driver.get(BasePage.base_url)
+        wait_for_presence(driver, (By.ID, "login-button"))
+        yield driver
+        return
+
+    if request.config.getoption("--reuse-browser"):
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire(browser, fast=fast)
+        yield instrument(request, driver)
+        if getattr(request.node, "browser_crashed", False):
+            pool.discard(driver)
         else:
-            prefs = {
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False
-            }
-            options.add_experimental_option("prefs", prefs)
+            pool.release(driver, browser, fast=fast)
+        return
 
-            driver = webdriver.Chrome(options=options)
+    driver = create_driver(browser, fast=fast)
+    driver.get(BasePage.base_url)
+    wait_for_presence(driver, (By.ID, "login-button"))
 
-    driver.get("https://www.saucedemo.com/")
-    time.sleep(0.7)
-
-    yield driver
+    yield instrument(request, driver)
     driver.quit()
 
 
-# Screenshot on failure
-@pytest.hookimpl(tryfirst=True, hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """Screenshot on failure"""
-    outcome = yield
-    rep = outcome.get_result()
-
-    if rep.when == "call" and rep.failed:
-        driver = item.funcargs.get('driver')
-        if driver:
-            os.makedirs("screenshots", exist_ok=True)
-            screenshot_path = f"screenshots/{item.name}.png"
-            driver.save_screenshot(screenshot_path)
-
-            try:
-                allure.attach(
-                    driver.get_screenshot_as_png(),
-                    name=item.name,
-                    attachment_type=allure.attachment_type.PNG
-                )
-            except:
-                pass
\ No newline at end of file
+@pytest.fixture
+def logged_in_driver(request, driver):
+    """
+    Driver already logged in through the session cookie, on inventory.html.
+    Pick the user with indirect parametrization, default standard_user:
+        @pytest.mark.parametrize("logged_in_driver", ["problem_user"], indirect=True)
+    """
+    user = getattr(request, "param", "standard_user")
+    LoginPage(driver).login_via_session(user)
+    return driver
+
@@ -0,0 +1 @@
+"""Concurrent load runs of the page-object user journeys"""
\ No newline at end of file
@@ -0,0 +1,84 @@
+import argparse
+import json
+from loadgen.journeys import JOURNEYS
+from loadgen.runner import LoadRunner
+from pages.base_page import BasePage
+from utils import driver_factory
+from utils.driver_cache import CACHE_DIR, DriverCache
+
+
+def think_range(text):
+    """'2' -> (2.0, 2.0), '1-3' -> (1.0, 3.0)"""
+    low, _, high = text.partition("-")
+    return float(low), float(high or low)
+
+
+def print_summary(summary):
+    print(
+        f"\n {summary['journeys']} journeys in {summary['elapsed_s']}s "
+        f"({summary['journeys_per_minute']}/min)"
+    )
+    print(f" {'step':<14}{'count':>7}{'/s':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for step, stats in summary["steps"].items():
+        print(
+            f" {step:<14}{stats['count']:>7}{stats['per_second']:>8}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}"
+        )
+    for error, count in sorted(summary["errors"].items()):
+        print(f" [ERROR] {count}x {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay page-object journeys in concurrent headless browsers")
+    parser.add_argument("--journey", choices=sorted(JOURNEYS), default="checkout")
+    parser.add_argument("--users", type=int, default=5, help="Concurrent virtual users (browsers)")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds until all users have started")
+    parser.add_argument("--duration", type=float, default=60.0, help="Stop starting journeys after this many seconds")
+    parser.add_argument("--iterations", type=int, default=None, help="Journeys per user (overrides --duration)")
+    parser.add_argument("--think-time", type=think_range, default=(1.0, 3.0), metavar="MIN[-MAX]",
+                        help="Seconds to wait between steps, uniform in MIN-MAX")
+    parser.add_argument("--browser", default="chrome", help="Browser: chrome, chromium, or firefox")
+    parser.add_argument("--headed", action="store_true", help="Show the browsers instead of the --fast headless profile")
+    parser.add_argument("--base-url", default=BasePage.base_url, help="Site under test")
+    parser.add_argument("--local-server", action="store_true", help="Start the bundled SauceDemo stand-in and load it")
+    parser.add_argument("--output", help="Write the summary as JSON to this path")
+    parser.add_argument("--driver-cache", nargs="?", const=CACHE_DIR, default=None, metavar="DIR",
+                        help="Resolve the driver once and launch every user from a template profile")
+    args = parser.parse_args()
+
+    if args.driver_cache:
+        driver_factory.driver_cache = DriverCache(args.driver_cache)
+
+    server = None
+    if args.local_server:
+        from standin.server import StandinServer
+        server = StandinServer().start()
+        BasePage.base_url = server.url
+    else:
+        BasePage.base_url = args.base_url if args.base_url.endswith("/") else args.base_url + "/"
+
+    runner = LoadRunner(
+        JOURNEYS[args.journey],
+        users=args.users,
+        ramp_up=args.ramp_up,
+        duration=None if args.iterations else args.duration,
+        iterations=args.iterations,
+        think_time=args.think_time,
+        browser=args.browser,
+        fast=not args.headed
+    )
+    print(f"[INFO] {args.users} users, {args.journey} journey against {BasePage.base_url}")
+    try:
+        summary = runner.run().summary()
+    finally:
+        if server:
+            server.stop()
+
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
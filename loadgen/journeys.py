@@ -0,0 +1,50 @@
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+
+
+def checkout_journey(driver, username="standard_user", password="secret_sauce"):
+    """
+    login -> add -> cart -> checkout -> finish, the flow of test_user_journey.py.
+
+    Yields (step name, callable) so the runner can time each step and think
+    between them.
+    """
+    login_page = LoginPage(driver)
+    products_page = ProductsPage(driver)
+    cart_page = CartPage(driver)
+    checkout_page = CheckoutPage(driver)
+
+    def login():
+        login_page.login(username, password)
+        if not login_page.is_logged_in():
+            raise AssertionError(f"{username} did not reach the inventory page")
+
+    def add_to_cart():
+        products_page.add_product_to_cart(0)
+
+    def open_cart():
+        products_page.go_to_cart()
+        cart_page.wait_for_cart_to_load()
+
+    def checkout():
+        cart_page.click_checkout()
+        checkout_page.fill_checkout_info("Load", "User", "12345")
+        checkout_page.click_continue()
+
+    def finish():
+        checkout_page.click_finish()
+        if not checkout_page.is_checkout_complete():
+            raise AssertionError("Checkout did not complete")
+
+    yield "login", login
+    yield "add_to_cart", add_to_cart
+    yield "cart", open_cart
+    yield "checkout", checkout
+    yield "finish", finish
+
+
+JOURNEYS = {
+    "checkout": checkout_journey,
+}
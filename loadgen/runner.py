@@ -0,0 +1,164 @@
+import random
+import statistics
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+from pages.base_page import BasePage
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.stats import percentile
+
+
+class LoadResults:
+    """Step latencies, completed journeys and errors of all virtual users (thread-safe)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.journeys = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def add_step(self, step, seconds):
+        with self.lock:
+            self.latencies.setdefault(step, []).append(seconds)
+
+    def add_error(self, step, error):
+        with self.lock:
+            key = f"{step}: {error.__class__.__name__}"
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def add_journey(self):
+        with self.lock:
+            self.journeys += 1
+
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self):
+        elapsed = self.elapsed()
+        steps = {}
+        for step, values in self.latencies.items():
+            ms = [value * 1000 for value in values]
+            steps[step] = {
+                "count": len(ms),
+                "per_second": round(len(ms) / elapsed, 3) if elapsed else 0.0,
+                "mean_ms": round(statistics.mean(ms), 1),
+                "p50_ms": round(percentile(ms, 50), 1),
+                "p95_ms": round(percentile(ms, 95), 1),
+                "p99_ms": round(percentile(ms, 99), 1),
+                "max_ms": round(max(ms), 1),
+            }
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "journeys": self.journeys,
+            "journeys_per_minute": round(self.journeys / elapsed * 60, 2) if elapsed else 0.0,
+            "errors": dict(self.errors),
+            "steps": steps,
+        }
+
+
+class LoadRunner:
+    """
+    Runs a page-object journey (loadgen/journeys.py) in N concurrent browsers.
+
+    Virtual user i starts at i * ramp_up / users seconds, then repeats the
+    journey until `duration` seconds have passed since the run started or it
+    completed `iterations` journeys. Between steps it thinks for a random
+    time in think_time=(min, max) seconds. Each virtual user keeps its own
+    warm browser through a DriverPool, which also resets it between journeys.
+    A failed step ends that journey; the browser is reset (or relaunched) and
+    the user starts over. A failed launch counts as a journey, and a user
+    whose browser fails to launch max_launch_failures times in a row stops.
+    """
+
+    max_launch_failures = 3
+
+    def __init__(self, journey, users=1, ramp_up=0.0, duration=60.0, iterations=None,
+                 think_time=(0.0, 0.0), browser="chrome", fast=True, factory=create_driver):
+        self.journey = journey
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.iterations = iterations
+        self.think_time = think_time
+        self.browser = browser
+        self.fast = fast
+        self.factory = factory
+        self.stop_event = threading.Event()
+        self.results = LoadResults()
+
+    def run(self):
+        self.results = LoadResults()
+        threads = [
+            threading.Thread(target=self.virtual_user, args=(index,), name=f"vuser-{index}", daemon=True)
+            for index in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+        self.results.finished = time.perf_counter()
+        return self.results
+
+    def should_stop(self, completed):
+        if self.stop_event.is_set():
+            return True
+        if self.iterations is not None and completed >= self.iterations:
+            return True
+        return self.duration is not None and self.results.elapsed() >= self.duration
+
+    def think(self):
+        low, high = self.think_time
+        if high > 0:
+            self.stop_event.wait(random.uniform(low, high))
+
+    def virtual_user(self, index):
+        if self.users > 1 and self.stop_event.wait(index * self.ramp_up / self.users):
+            return
+
+        pool = DriverPool(self.factory, BasePage.base_url)
+        completed = 0
+        launch_failures = 0
+        try:
+            while not self.should_stop(completed):
+                try:
+                    driver = pool.acquire(self.browser, fast=self.fast)
+                except WebDriverException as e:
+                    self.results.add_error("launch", e)
+                    completed += 1
+                    launch_failures += 1
+                    if launch_failures >= self.max_launch_failures:
+                        print(f"[ERROR] vuser-{index}: browser failed to launch {launch_failures} times in a row, stopping")
+                        return
+                    self.stop_event.wait(1)
+                    continue
+
+                launch_failures = 0
+                if self.run_journey(driver):
+                    self.results.add_journey()
+                completed += 1
+                pool.release(driver, self.browser, fast=self.fast)
+        finally:
+            pool.close()
+
+    def run_journey(self, driver):
+        for step, action in self.journey(driver):
+            started = time.perf_counter()
+            try:
+                action()
+            except Exception as e:
+                self.results.add_error(step, e)
+                return False
+            self.results.add_step(step, time.perf_counter() - started)
+
+            if self.stop_event.is_set():
+                return False
+            self.think()
+        return True
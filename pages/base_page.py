@@ -0,0 +1,122 @@
+import time
+from urllib.parse import urljoin
+from selenium.common.exceptions import StaleElementReferenceException
+from pages.models import CartItem, parse_price
+from utils import waits
+from utils.element_cache import ElementCache
+
+# Reads every .cart_item (cart page and checkout overview) in one round-trip
+CART_ITEMS_SCRIPT = """
+return Array.from(document.querySelectorAll('.cart_item')).map(function (item) {
+    function text(selector) {
+        var el = item.querySelector(selector);
+        return el ? (el.innerText || el.textContent).trim() : '';
+    }
+    return {
+        name: text('.inventory_item_name'),
+        price: text('.inventory_item_price'),
+        description: text('.inventory_item_desc'),
+        quantity: text('.cart_quantity')
+    };
+});
+"""
+
+# True once every <img> in or at the given elements finished loading (or failing)
+IMAGES_SETTLED_SCRIPT = """
+return Array.from(arguments[0]).every(function (el) {
+    var images = el.tagName === 'IMG' ? [el] : Array.from(el.querySelectorAll('img'));
+    return images.every(function (img) { return img.complete; });
+});
+"""
+
+
+def cart_item(item):
+    """CART_ITEMS_SCRIPT row -> CartItem"""
+    return CartItem(
+        name=item["name"],
+        price=parse_price(item["price"]),
+        description=item["description"],
+        quantity=int(item["quantity"] or 1)
+    )
+
+
+class BasePage:
+    """Shared waits for all page objects - no fixed sleeps"""
+
+    base_url = "https://www.saucedemo.com/"
+    # PageMetrics of the running test, set by the page_metrics fixture
+    page_metrics = None
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.elements = ElementCache(driver)
+
+    def url(self, path=""):
+        return urljoin(self.base_url, path)
+
+    def wait_visible(self, locator, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_visible(self.driver, locator, timeout)
+
+    def wait_clickable(self, locator, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_clickable(self.driver, locator, timeout)
+
+    def wait_present(self, locator, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_presence(self.driver, locator, timeout)
+
+    def wait_all_present(self, locator, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_for_all_present(self.driver, locator, timeout)
+
+    def wait_until(self, condition, timeout=waits.DEFAULT_TIMEOUT):
+        return waits.wait_until(self.driver, condition, timeout)
+
+    def find_all_cached(self, locator, timeout=None):
+        """find_elements() served from the page cache; waits for presence on a miss if timeout is given"""
+        if locator not in self.elements and timeout is not None:
+            return self.elements.put(locator, self.wait_all_present(locator, timeout))
+        return self.elements.get(locator)
+
+    def read_cached(self, locator, read, timeout=None):
+        """Call read(elements) on cached elements, re-finding them once if they went stale"""
+        try:
+            return read(self.find_all_cached(locator, timeout))
+        except StaleElementReferenceException:
+            self.elements.invalidate(locator)
+            return read(self.find_all_cached(locator, timeout))
+
+    def record_navigation(self, started, user=None):
+        """Sample page metrics of this driver for a navigation that began at time.perf_counter() == started"""
+        if self.page_metrics is not None:
+            self.page_metrics.sample(self.driver, time.perf_counter() - started, user)
+
+    def read_cart_items(self):
+        return [cart_item(item) for item in self.driver.execute_script(CART_ITEMS_SCRIPT)]
+
+    def capture_elements(self, locator, timeout=waits.DEFAULT_TIMEOUT):
+        """Element-level PNG screenshots of every match, once their images have settled"""
+        elements = self.wait_all_present(locator, timeout)
+        self.wait_until(lambda d: d.execute_script(IMAGES_SETTLED_SCRIPT, elements), timeout)
+        return [element.screenshot_as_png for element in elements]
+
+    def scroll_into_view(self, element):
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+
+    def click_and_wait_for_url(self, element, url_fragment, timeout=waits.DEFAULT_TIMEOUT):
+        """Click an element that navigates and wait for the new page"""
+        started = time.perf_counter()
+        element.click()
+        self.elements.invalidate()
+        waits.wait_for_url_contains(self.driver, url_fragment, timeout)
+        waits.wait_for_document_ready(self.driver, timeout)
+        self.record_navigation(started)
+
+    def click_and_wait_for_removal(self, element, removed, timeout=waits.DEFAULT_TIMEOUT):
+        """Click an element and wait until `removed` is detached from the DOM"""
+        element.click()
+        waits.wait_for_staleness(self.driver, removed, timeout)
+        self.elements.invalidate()
+
+    def click_and_wait_for_dom_change(self, element, css_selector="body", timeout=waits.DEFAULT_TIMEOUT):
+        waits.watch_dom(self.driver, css_selector)
+        element.click()
+        waits.wait_for_dom_mutation(self.driver, timeout)
+        self.elements.invalidate()
@@ -1,12 +1,12 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.lazy import By
+from pages.base_page import BasePage
+from utils import waits
+from utils.retry import retry_action
 
 
-class CartPage:
+class CartPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.cart_item = (By.CLASS_NAME, "cart_item")
         self.cart_list = (By.CLASS_NAME, "cart_list")
         self.checkout_button = (By.ID, "checkout")
@@ -14,38 +14,36 @@ class CartPage:
 
     def wait_for_cart_to_load(self, timeout=10):
         """Wait for cart page to load"""
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(self.cart_list)
-        )
-        time.sleep(0.5)
+        self.wait_present(self.cart_list, timeout)
+        waits.wait_for_document_ready(self.driver, timeout)
 
     def get_items_count(self):
         return len(self.driver.find_elements(*self.cart_item))
 
+    @retry_action(done=lambda page: "inventory.html" in page.driver.current_url)
     def click_continue_shopping(self):
         """Click continue shopping button"""
-        btn = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.continue_shopping_btn)
-        )
+        btn = self.wait_clickable(self.continue_shopping_btn)
         #  Scroll to button
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-        time.sleep(0.3)
-        btn.click()
+        self.scroll_into_view(btn)
         #  Wait for navigation
-        time.sleep(1)
+        self.click_and_wait_for_url(btn, "inventory.html")
 
+    @retry_action(done=lambda page: "checkout-step-one" in page.driver.current_url)
     def click_checkout(self):
         """Click checkout button"""
-        btn = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.checkout_button)
-        )
+        btn = self.wait_clickable(self.checkout_button)
         #  Scroll to button
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", btn)
-        time.sleep(0.3)
-        btn.click()
+        self.scroll_into_view(btn)
         #  Wait for navigation
-        time.sleep(1)
+        self.click_and_wait_for_url(btn, "checkout-step-one.html")
 
+    @retry_action
+    def get_items(self):
+        """All cart lines (name, price, description, quantity) in one script call"""
+        return self.read_cart_items()
+
+    @retry_action
     def get_first_item_name(self):
         items = self.driver.find_elements(*self.cart_item)
         if not items:
@@ -56,12 +54,10 @@ class CartPage:
         """Remove first item from cart"""
         #  Find remove button for first item
         remove_btn = self.driver.find_element(By.CSS_SELECTOR, "button[id^='remove-']")
+        item = self.driver.find_element(*self.cart_item)
 
         #  Scroll to button
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", remove_btn)
-        time.sleep(0.3)
-
-        remove_btn.click()
+        self.scroll_into_view(remove_btn)
 
         #  Wait for item to be removed
-        time.sleep(1)
\ No newline at end of file
+        self.click_and_wait_for_removal(remove_btn, item)
@@ -1,35 +1,85 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utils.lazy import By, EC
+from pages.base_page import CART_ITEMS_SCRIPT, BasePage, cart_item
+from pages.models import OrderSummary, parse_price
+from utils.retry import retry_action
 
-class CheckoutPage:
+# checkout-step-two: every line plus item total, tax and total in one round-trip
+OVERVIEW_SCRIPT = "var items = (function () {" + CART_ITEMS_SCRIPT + "})();" + """
+function label(selector) {
+    var el = document.querySelector(selector);
+    return el ? (el.innerText || el.textContent).trim() : '';
+}
+return {
+    items: items,
+    subtotal: label('.summary_subtotal_label'),
+    tax: label('.summary_tax_label'),
+    total: label('.summary_total_label')
+};
+"""
+
+
+class CheckoutPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.first_name_input = (By.ID, "first-name")
         self.last_name_input = (By.ID, "last-name")
         self.postal_code_input = (By.ID, "postal-code")
         self.continue_btn = (By.ID, "continue")
         self.finish_btn = (By.ID, "finish")
         self.complete_header = (By.CLASS_NAME, "complete-header")
+        self.total_label = (By.CLASS_NAME, "summary_total_label")
+        self.error_message = (By.CSS_SELECTOR, "[data-test='error']")
+        self.step_container = (
+            By.CSS_SELECTOR, "#checkout_info_container, #checkout_summary_container, #checkout_complete_container"
+        )
 
     def fill_checkout_info(self, first, last, postal):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.first_name_input)
-        ).send_keys(first)
+        self.wait_visible(self.first_name_input).send_keys(first)
         self.driver.find_element(*self.last_name_input).send_keys(last)
         self.driver.find_element(*self.postal_code_input).send_keys(postal)
 
     def click_continue(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.continue_btn)
-        ).click()
+        self.wait_clickable(self.continue_btn).click()
+
+    def submit_info(self):
+        """click_continue() and wait until step two opened or a validation error is shown"""
+        self.click_continue()
+        self.wait_until(EC.any_of(
+            EC.url_contains("checkout-step-two"),
+            EC.visibility_of_element_located(self.error_message)
+        ))
 
     def click_finish(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.finish_btn)
-        ).click()
+        self.wait_clickable(self.finish_btn).click()
+
+    def get_error_message(self):
+        errors = self.driver.find_elements(*self.error_message)
+        return errors[0].text if errors else ""
+
+    def is_at_step_two(self):
+        return "checkout-step-two" in self.driver.current_url
+
+    @retry_action
+    def get_overview_items(self):
+        """All lines on checkout-step-two in one script call"""
+        return self.read_cart_items()
+
+    @retry_action
+    def get_order_summary(self):
+        """OrderSummary of checkout-step-two from a single script call"""
+        self.wait_visible(self.total_label)
+        overview = self.driver.execute_script(OVERVIEW_SCRIPT)
+        return OrderSummary(
+            items=[cart_item(item) for item in overview["items"]],
+            subtotal=parse_price(overview["subtotal"]),
+            tax=parse_price(overview["tax"]),
+            total=parse_price(overview["total"])
+        )
+
+    @retry_action
+    def capture_step(self):
+        """Element screenshot of the current step: info form, overview or complete"""
+        return self.capture_elements(self.step_container)[0]
 
     def is_checkout_complete(self):
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.complete_header)
-        ).is_displayed()
+        return self.wait_visible(self.complete_header).is_displayed()
@@ -0,0 +1,73 @@
+import time
+from selenium.common.exceptions import TimeoutException
+from utils.lazy import By
+from pages.base_page import BasePage
+from pages.checkout_page import CheckoutPage
+from pages.login_page import LoginPage
+from test_data import products
+
+
+class CheckoutState(BasePage):
+    """
+    Builder that seeds session + cart state and opens a checkout step directly,
+    skipping login -> add product -> cart -> checkout through the UI.
+
+        checkout = CheckoutState(driver).with_products(0).at_step_one()
+        checkout = CheckoutState(driver).with_products(0, 2, 4).at_step_two()
+    """
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.username = "standard_user"
+        self.cart_items = []
+        self.cart_item = (By.CLASS_NAME, "cart_item")
+        self.first_name_input = (By.ID, "first-name")
+        self.finish_btn = (By.ID, "finish")
+        self.opened_at = None
+
+    def as_user(self, username):
+        self.username = username
+        return self
+
+    def with_products(self, *indices):
+        """Add products by their position on the inventory page (default sort)"""
+        self.cart_items.extend(products[index]["id"] for index in indices)
+        return self
+
+    def with_item_ids(self, *item_ids):
+        self.cart_items.extend(item_ids)
+        return self
+
+    def at_step_one(self):
+        self.open("checkout-step-one.html")
+        self.verify_rendered("checkout-step-one", self.first_name_input)
+        return CheckoutPage(self.driver)
+
+    def at_step_two(self):
+        self.open("checkout-step-two.html")
+        self.verify_rendered("checkout-step-two", self.finish_btn)
+
+        items_count = len(self.driver.find_elements(*self.cart_item))
+        if items_count != len(self.cart_items):
+            raise RuntimeError(
+                f"checkout-step-two shows {items_count} items, seeded {len(self.cart_items)}"
+            )
+        return CheckoutPage(self.driver)
+
+    def open(self, path):
+        LoginPage(self.driver).seed_session(self.username, self.cart_items)
+        self.opened_at = time.perf_counter()
+        self.driver.get(self.url(path))
+
+    def verify_rendered(self, url_fragment, locator):
+        """Make sure the site really rendered the step instead of redirecting"""
+        try:
+            self.wait_visible(locator)
+        except TimeoutException:
+            raise RuntimeError(
+                f"{url_fragment} did not render for {self.username}, "
+                f"landed on {self.driver.current_url}"
+            )
+        if url_fragment not in self.driver.current_url:
+            raise RuntimeError(f"Expected {url_fragment}, landed on {self.driver.current_url}")
+        self.record_navigation(self.opened_at, self.username)
@@ -0,0 +1,100 @@
+"""
+SauceDemo's checkout-step-two arithmetic as a batch model.
+
+Item total is the sum of the line prices, tax is 8% of the item total
+rounded to the cent, and total is item total plus tax. The model works in
+integer cents, so every amount is exact. 8% of a whole number of cents is
+never exactly half a cent, so the rounding direction can't matter either.
+
+TotalsModel prices any number of carts at once: a (carts x catalog) matrix
+of quantities times the catalog's price vector, then tax and total on the
+resulting column, all NumPy int64. verify() compares OrderSummary objects
+read from the page (CheckoutPage.get_order_summary) against that in one go.
+"""
+import itertools
+from decimal import Decimal
+
+TAX_RATE_PERCENT = 8
+CENT = Decimal("0.01")
+
+
+def to_cents(amount):
+    return int((Decimal(amount) * 100).to_integral_value())
+
+
+def to_decimal(cents):
+    return (Decimal(int(cents)) / 100).quantize(CENT)
+
+
+def every_cart(names):
+    """Every non-empty combination of names, smallest carts first"""
+    return [list(cart) for size in range(1, len(names) + 1) for cart in itertools.combinations(names, size)]
+
+
+def cart_of(summary):
+    """Product names of an OrderSummary, repeated by quantity"""
+    return [item.name for item in summary.items for _ in range(item.quantity)]
+
+
+class TotalsModel:
+    """Expected item total, tax and total for batches of carts over one catalog"""
+
+    def __init__(self, catalog):
+        import numpy as np
+
+        self.names = [product["name"] for product in catalog]
+        self.index = {name: column for column, name in enumerate(self.names)}
+        self.prices = {product["name"]: Decimal(product["price"]) for product in catalog}
+        self.cents = np.array([to_cents(product["price"]) for product in catalog], dtype=np.int64)
+
+    def quantities(self, carts):
+        """carts (lists of product names, repeats = quantity) -> int64 matrix, one row per cart"""
+        import numpy as np
+
+        matrix = np.zeros((len(carts), len(self.names)), dtype=np.int64)
+        for row, cart in enumerate(carts):
+            for name in cart:
+                matrix[row, self.index[name]] += 1
+        return matrix
+
+    def expected_cents(self, carts):
+        """(subtotal, tax, total) int64 arrays in cents, one entry per cart"""
+        subtotal = self.quantities(carts) @ self.cents
+        tax = (subtotal * TAX_RATE_PERCENT + 50) // 100
+        return subtotal, tax, subtotal + tax
+
+    def expected(self, cart):
+        """(subtotal, tax, total) as Decimals for a single cart"""
+        return tuple(to_decimal(column[0]) for column in self.expected_cents([cart]))
+
+    def verify(self, summaries, carts=None):
+        """
+        Differences between page summaries and the model, [] when every cart adds up.
+        carts defaults to the lines each summary shows; pass the seeded carts to
+        also catch missing or extra lines.
+        """
+        import numpy as np
+
+        carts = [cart_of(summary) for summary in summaries] if carts is None else carts
+        expected = np.stack(self.expected_cents(carts), axis=1)
+        shown = np.array(
+            [[to_cents(summary.subtotal), to_cents(summary.tax), to_cents(summary.total)] for summary in summaries],
+            dtype=np.int64
+        ).reshape(-1, 3)
+
+        problems = []
+        for row in np.flatnonzero((shown != expected).any(axis=1)):
+            amounts = ", ".join(
+                f"{label} ${to_decimal(shown[row, column])} != ${to_decimal(expected[row, column])}"
+                for column, label in enumerate(("item total", "tax", "total"))
+                if shown[row, column] != expected[row, column]
+            )
+            problems.append(f"{' + '.join(carts[row])}: {amounts}")
+
+        for cart, summary in zip(carts, summaries):
+            if sorted(cart) != sorted(cart_of(summary)):
+                problems.append(f"{' + '.join(cart)}: overview shows {cart_of(summary)}")
+            for item in summary.items:
+                if self.prices.get(item.name) != item.price:
+                    problems.append(f"{item.name}: line price ${item.price} != ${self.prices.get(item.name)}")
+        return problems
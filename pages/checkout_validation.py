@@ -0,0 +1,50 @@
+"""
+SauceDemo's checkout-step-one validation as a plain model.
+
+The site only requires each field to be non-empty, checked in page order,
+and shows the first failure. Whitespace, length and character set are not
+validated. The stand-in serves CHECKOUT_FIELDS to its form logic, so the
+model and the stand-in can't drift apart; the browser tests in
+tests/test_checkout_validation.py cross-check a sample against the real site.
+"""
+
+# (input id, label in the error message), in the order the site checks them
+CHECKOUT_FIELDS = [
+    ("first-name", "First Name"),
+    ("last-name", "Last Name"),
+    ("postal-code", "Postal Code"),
+]
+
+
+def checkout_error(first, last, postal):
+    """The error checkout-step-one shows for these inputs, None when it moves on to step two"""
+    for (_, label), value in zip(CHECKOUT_FIELDS, (first, last, postal)):
+        if not value:
+            return f"Error: {label} is required"
+    return None
+
+
+class CheckoutFormModel:
+    """DOM-less stand-in for CheckoutPage on step one, same methods as the page object"""
+
+    def __init__(self):
+        self.values = ("", "", "")
+        self.error = None
+        self.step = "checkout-step-one"
+
+    def fill_checkout_info(self, first, last, postal):
+        self.values = (first, last, postal)
+
+    def click_continue(self):
+        self.error = checkout_error(*self.values)
+        if self.error is None:
+            self.step = "checkout-step-two"
+
+    def submit_info(self):
+        self.click_continue()
+
+    def get_error_message(self):
+        return self.error or ""
+
+    def is_at_step_two(self):
+        return self.step == "checkout-step-two"
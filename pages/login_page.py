@@ -1,11 +1,13 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import json
+import time
+from utils.lazy import By, EC
+from pages.base_page import BasePage
+from test_data import users
 
-class LoginPage:
+class LoginPage(BasePage):
 
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.username_input = (By.ID, "user-name")
@@ -14,51 +16,75 @@ class LoginPage:
         self.error_message = (By.CSS_SELECTOR, "h3[data-test='error']")
 
     def login(self, username, password):
-        wait = WebDriverWait(self.driver, 10)
-        wait.until(EC.visibility_of_element_located(self.username_input)).send_keys(username)
-        wait.until(EC.visibility_of_element_located(self.password_input)).send_keys(password)
-        wait.until(EC.element_to_be_clickable(self.login_button)).click()
+        self.wait_visible(self.username_input).send_keys(username)
+        self.wait_visible(self.password_input).send_keys(password)
+        started = time.perf_counter()
+        self.wait_clickable(self.login_button).click()
+
+        if self.page_metrics is not None:
+            self.wait_until(EC.any_of(
+                EC.presence_of_element_located((By.CLASS_NAME, "inventory_list")),
+                EC.visibility_of_element_located(self.error_message)
+            ))
+            self.record_navigation(started, username)
+
+    def login_via_session(self, username, cart_items=()):
+        """
+        Log in without the login form by writing the session cookie and cart directly.
+        cart_items are SauceDemo product ids, e.g. [4, 0].
+        """
+        self.seed_session(username, cart_items)
+        started = time.perf_counter()
+        self.driver.get(self.url("inventory.html"))
+        self.wait_present((By.CLASS_NAME, "inventory_list"))
+        self.record_navigation(started, username)
+
+    def seed_session(self, username, cart_items=()):
+        """Write the session cookie and cart for the site origin, without opening a page"""
+        user = next((u for u in users if u["username"] == username), None)
+        if user is None or user["expected_behavior"] == "locked_out":
+            raise ValueError(f"{username} cannot log in, use login() to test the error path")
+
+        # Cookies and localStorage belong to the origin that is currently loaded
+        if not self.driver.current_url.startswith(self.base_url):
+            self.driver.get(self.base_url)
+
+        self.driver.add_cookie({"name": "session-username", "value": username, "path": "/"})
+        if cart_items:
+            self.driver.execute_script(
+                "window.localStorage.setItem('cart-contents', arguments[0]);",
+                json.dumps(list(cart_items))
+            )
+        else:
+            self.driver.execute_script("window.localStorage.removeItem('cart-contents');")
 
     def get_error_message(self):
-        wait = WebDriverWait(self.driver, 5)
         try:
-            return wait.until(EC.visibility_of_element_located(self.error_message)).text
+            return self.wait_visible(self.error_message, 5).text
         except:
             return ""
 
     def is_logged_in(self):
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "inventory_list"))
-            )
+            self.wait_present((By.CLASS_NAME, "inventory_list"), 5)
             return True
         except:
             return False
 
     def is_locked_out_error(self):
         try:
-            error_message = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test='error']"))
-            )
+            error_message = self.wait_present((By.CSS_SELECTOR, "[data-test='error']"), 5)
             return "locked out" in error_message.text.lower()
         except:
             return False
 
-    def has_broken_images(self):
-        broken_images = self.driver.execute_script(
-            "return Array.from(document.images).filter(img => !img.complete).length"
-        )
-        return broken_images > 0
-
     def is_page_loaded_quickly(self):
         import time
         start_time = time.time()
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "inventory_list"))
-            )
+            self.wait_present((By.CLASS_NAME, "inventory_list"), 5)
             end_time = time.time()
             load_time = end_time - start_time
             return load_time < 5
         except:
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+def parse_price(text):
+    """'$29.99' or 'Item total: $29.99' -> Decimal('29.99')"""
+    return Decimal(text.split("$")[-1].strip())
+
+
+@dataclass
+class Product:
+    name: str
+    price: Decimal
+    description: str
+    button_text: str
+    image_src: str
+
+    @property
+    def in_cart(self):
+        return self.button_text == "Remove"
+
+
+@dataclass
+class CartItem:
+    name: str
+    price: Decimal
+    description: str
+    quantity: int
+
+
+@dataclass
+class OrderSummary:
+    """checkout-step-two: the lines and the three summary amounts"""
+    items: list
+    subtotal: Decimal
+    tax: Decimal
+    total: Decimal
@@ -1,32 +1,28 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utils.lazy import By
+from pages.base_page import BasePage
+from utils.retry import retry_action
 
-class ProductDetailsPage:
+
+class ProductDetailsPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.title = (By.CLASS_NAME, "inventory_details_name")
         self.description = (By.CLASS_NAME, "inventory_details_desc")
         self.price = (By.CLASS_NAME, "inventory_details_price")
         self.back_button = (By.ID, "back-to-products")
 
     # ---- Details ----
+    @retry_action
     def get_title(self):
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.title)
-        ).text
+        return self.wait_visible(self.title).text
 
+    @retry_action
     def get_description(self):
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.description)
-        ).text
+        return self.wait_visible(self.description).text
 
+    @retry_action
     def get_price(self):
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.price)
-        ).text
+        return self.wait_visible(self.price).text
 
     def click_back(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.back_button)
-        ).click()
+        self.wait_clickable(self.back_button).click()
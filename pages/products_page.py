@@ -1,38 +1,97 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utils.lazy import By
+from pages.base_page import BasePage
+from pages.models import Product, parse_price
+from utils.retry import retry_action
+from utils.visual import lookalikes
 
-class ProductsPage:
+CATALOG_SCRIPT = """
+return Array.from(document.querySelectorAll('.inventory_item')).map(function (item) {
+    function text(selector) {
+        var el = item.querySelector(selector);
+        return el ? (el.innerText || el.textContent).trim() : '';
+    }
+    var img = item.querySelector('img');
+    return {
+        name: text('.inventory_item_name'),
+        price: text('.inventory_item_price'),
+        description: text('.inventory_item_desc'),
+        button: text('.btn_inventory'),
+        image: img ? img.getAttribute('src') : ''
+    };
+});
+"""
+
+# Names of products whose picture failed to load
+UNLOADED_IMAGES_SCRIPT = """
+return Array.from(document.querySelectorAll('.inventory_item')).filter(function (item) {
+    var img = item.querySelector('img');
+    return !img || img.naturalWidth === 0;
+}).map(function (item) {
+    return item.querySelector('.inventory_item_name').textContent.trim();
+});
+"""
+
+class ProductsPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.page_title = (By.CLASS_NAME, "title")
         self.products_list = (By.CLASS_NAME, "inventory_item")
         self.add_buttons = (By.CLASS_NAME, "btn_inventory")
         self.cart_icon = (By.CLASS_NAME, "shopping_cart_link")
         self.sort_dropdown = (By.CLASS_NAME, "product_sort_container")
+        self.product_images = (By.CSS_SELECTOR, ".inventory_item img")
 
     def wait_for_page_to_load(self, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(self.page_title)
-        )
+        return self.wait_visible(self.page_title, timeout)
+
+    @retry_action
+    def get_catalog(self):
+        """Every product on the page, in display order, from a single script call"""
+        self.wait_all_present(self.products_list)
+        return [
+            Product(
+                name=item["name"],
+                price=parse_price(item["price"]),
+                description=item["description"],
+                button_text=item["button"],
+                image_src=item["image"]
+            )
+            for item in self.driver.execute_script(CATALOG_SCRIPT)
+        ]
+
+    def capture_product_images(self):
+        """{product name: element screenshot of its picture} for every product on the page"""
+        names = [product.name for product in self.get_catalog()]
+        return dict(zip(names, self.capture_elements(self.product_images)))
 
+    def broken_product_images(self):
+        """
+        Names of products whose picture failed to load or looks like another product's.
+        Every product has its own picture, so this needs no baselines and works headless.
+        """
+        images = self.capture_product_images()
+        unloaded = self.driver.execute_script(UNLOADED_IMAGES_SCRIPT)
+        return sorted(set(unloaded) | set(lookalikes(images)))
+
+    @retry_action
     def get_products_count(self):
-        return len(self.driver.find_elements(*self.products_list))
+        return len(self.find_all_cached(self.products_list))
 
+    @retry_action
     def toggle_product_in_cart(self, index=0, expected_text="Remove", timeout=5):
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located(self.add_buttons)
-        )
-        buttons = self.driver.find_elements(*self.add_buttons)
-        button = buttons[index]
+        expected = expected_text.lower()
+
+        def button_text(buttons):
+            return buttons[index].text.strip()
 
-        if button.text.strip().lower() != expected_text.lower():
-            button.click()
+        if self.read_cached(self.add_buttons, button_text, timeout).lower() != expected:
+            self.read_cached(self.add_buttons, lambda buttons: buttons[index].click(), timeout)
 
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: d.find_elements(*self.add_buttons)[index].text.strip().lower() == expected_text.lower()
+        self.wait_until(
+            lambda d: self.read_cached(self.add_buttons, button_text).lower() == expected,
+            timeout
         )
-        return self.driver.find_elements(*self.add_buttons)[index].text
+        return self.read_cached(self.add_buttons, button_text)
 
     def add_product_to_cart(self, index=0, timeout=5):
         return self.toggle_product_in_cart(index=index, expected_text="Remove", timeout=timeout)
@@ -47,30 +106,33 @@ class ProductsPage:
         except Exception:
             return 0
 
+    @retry_action(done=lambda page: "cart.html" in page.driver.current_url)
     def go_to_cart(self, timeout=10):
-        WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(self.cart_icon)
-        ).click()
+        self.click_and_wait_for_url(self.wait_clickable(self.cart_icon, timeout), "cart.html", timeout)
 
+    @retry_action(done=lambda page: "inventory-item" in page.driver.current_url)
     def open_product_details(self, index=0, timeout=10):
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_all_elements_located(self.products_list)
+        self.read_cached(
+            self.products_list,
+            lambda items: items[index].find_element(By.CLASS_NAME, "inventory_item_name").click(),
+            timeout
         )
-        items = self.driver.find_elements(*self.products_list)
-        items[index].find_element(By.CLASS_NAME, "inventory_item_name").click()
+        self.elements.invalidate()
 
+    @retry_action
     def sort_products(self, sort_option_text):
-        dropdown = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.sort_dropdown)
-        )
+        dropdown = self.wait_clickable(self.sort_dropdown)
         dropdown.click()
         opt = dropdown.find_element(By.XPATH, f".//option[text()='{sort_option_text}']")
-        opt.click()
+        if opt.is_selected():
+            opt.click()
+            return
+        #  Wait for the list to be re-rendered in the new order
+        self.click_and_wait_for_dom_change(opt, ".inventory_list")
 
+    @retry_action
     def get_product_name(self, index):
-        products = self.driver.find_elements(
-            By.CLASS_NAME,
-            "inventory_item"
+        return self.read_cached(
+            self.products_list,
+            lambda items: items[index].find_element(By.CLASS_NAME, "inventory_item_name").text
         )
-        return products[index].find_element(By.CLASS_NAME, "inventory_item_name").text
-
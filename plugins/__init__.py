@@ -0,0 +1 @@
+"""Pytest plugins"""
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Per-action WebDriver latency, opt in with --action-timings[=PATH].
+
+The driver fixture wraps each browser in an EventFiringWebDriver that times
+every find_element, click, send_keys, get and execute_script and tags it with
+the page-object method that issued it (see utils/instrumentation.py). Each
+test gets its own histogram as an Allure attachment. At session end the
+whole-run histogram is written to PATH (one file per xdist worker,
+"action_timings.gw0.json") and attached to Allure, and the terminal summary
+lists the page-object methods that spent the most time in WebDriver calls.
+"""
+import json
+import os
+import pytest
+from utils.lazy import allure
+
+DEFAULT_PATH = "action_timings.json"
+SUMMARY_LINES = 15
+
+
+def timings_path(config):
+    path = config.getoption("--action-timings")
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{workerinput['workerid']}{ext}"
+    return path
+
+
+def attach_histogram(histogram, name):
+    allure.attach(
+        json.dumps(histogram, indent=2, sort_keys=True),
+        name=name,
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--action-timings",
+        action="store",
+        nargs="?",
+        const=DEFAULT_PATH,
+        default=None,
+        metavar="PATH",
+        help=f"Time every WebDriver call per page-object method, export histogram JSON (default {DEFAULT_PATH})"
+    )
+
+
+def pytest_configure(config):
+    config.action_timings = None
+    if config.getoption("--action-timings"):
+        # EventFiringWebDriver lives in selenium.webdriver, keep it out of plain runs' startup
+        from utils.instrumentation import ActionTimings
+        config.action_timings = ActionTimings()
+
+
+@pytest.fixture(scope="session")
+def action_timings(request):
+    """The session's ActionTimings, or None without --action-timings"""
+    timings = request.config.action_timings
+    yield timings
+    if timings is None or not timings.records:
+        return
+
+    timings.export(timings_path(request.config))
+    attach_histogram(timings.histogram(), "action timings (session)")
+
+
+def instrument(request, driver):
+    """Wrap driver for timing if --action-timings is on, else return it unchanged"""
+    timings = request.getfixturevalue("action_timings")
+    if timings is None:
+        return driver
+    request.addfinalizer(
+        lambda: attach_histogram(timings.histogram(request.node.nodeid), "action timings")
+    )
+    return timings.wrap(driver, request.node.nodeid)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    timings = getattr(config, "action_timings", None)
+    if not timings or not timings.records:
+        return
+
+    tr = terminalreporter
+    tr.write_sep("-", "action timings")
+    tr.write_line(f"{len(timings.records)} WebDriver calls, histogram in {timings_path(config)}")
+    for method, seconds in timings.method_totals()[:SUMMARY_LINES]:
+        tr.write_line(f"  {seconds:7.2f}s  {method}")
@@ -0,0 +1,58 @@
+"""
+--allure-compact: stream Allure results into one compressed file per process.
+
+allure-pytest writes a JSON file per result, container and attachment. With
+this option its AllureFileLogger is swapped for CompactAllureLogger
+(utils/allure_compact.py), which appends everything to
+<alluredir>/results.<worker>.ndjson.gz. Expand the streams for
+`allure generate`, or get pass/fail/duration rollups straight from them:
+
+    python -m utils.allure_compact expand allure-results --out allure-expanded
+    python -m utils.allure_compact summary allure-results
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--allure-compact",
+        action="store_true",
+        default=False,
+        help="Write Allure results as one gzip'd NDJSON stream per worker instead of a file per entity"
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if not config.getoption("--allure-compact") or not report_dir:
+        return
+
+    import allure_commons
+    from allure_commons.logger import AllureFileLogger
+    from utils.allure_compact import CompactAllureLogger
+
+    config.allure_file_loggers = [
+        plugin for plugin in allure_commons.plugin_manager.get_plugins()
+        if isinstance(plugin, AllureFileLogger)
+    ]
+    for plugin in config.allure_file_loggers:
+        allure_commons.plugin_manager.unregister(plugin)
+
+    workerinput = getattr(config, "workerinput", None)
+    logger = CompactAllureLogger(report_dir, workerinput["workerid"] if workerinput else "main")
+    allure_commons.plugin_manager.register(logger)
+    config.compact_allure_logger = logger
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config):
+    logger = getattr(config, "compact_allure_logger", None)
+    if logger:
+        import allure_commons
+
+        allure_commons.plugin_manager.unregister(logger)
+        logger.close()
+        # allure-pytest's own cleanup unregisters its file logger by name
+        for plugin in config.allure_file_loggers:
+            allure_commons.plugin_manager.register(plugin)
@@ -0,0 +1,75 @@
+"""
+Browser affinity scheduling for pytest-xdist.
+
+With --browser-affinity every test is put in an xdist_group named after the
+browser it runs on plus a bucket number ("firefox-0", "chrome-1", ...) and
+xdist switches to --dist=loadgroup. A group always runs on one worker, so a
+worker only launches (and, with --reuse-browser, keeps warm) the browsers of
+the groups it received. Each browser gets a number of buckets proportional
+to its share of the recorded runtime. Tests are spread over those buckets
+longest-first onto the least loaded bucket.
+
+Expected durations are the rolling medians from plugins/duration_history.py.
+"""
+import pytest
+from plugins.duration_history import history_key
+from utils.nodes import item_browser
+
+DEFAULT_DURATION = 5.0
+
+
+def worker_count(config):
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput:
+        return workerinput["workercount"]
+    return config.getoption("numprocesses", default=0) or 0
+
+
+def assign_groups(items, history, workers):
+    """Return {nodeid: group name}, balancing buckets by expected duration"""
+    by_browser = {}
+    for item in items:
+        by_browser.setdefault(item_browser(item), []).append(item)
+
+    def duration(item):
+        return history.median(history_key(item.nodeid, item_browser(item)), DEFAULT_DURATION)
+
+    total = sum(duration(item) for item in items) or 1.0
+    groups = {}
+    for browser, browser_items in sorted(by_browser.items()):
+        share = sum(duration(item) for item in browser_items) / total
+        buckets = min(len(browser_items), max(1, round(share * workers)))
+        loads = [0.0] * buckets
+
+        for item in sorted(browser_items, key=lambda i: (-duration(i), i.nodeid)):
+            bucket = loads.index(min(loads))
+            loads[bucket] += duration(item)
+            groups[item.nodeid] = f"{browser}-{bucket}"
+    return groups
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-affinity",
+        action="store_true",
+        default=False,
+        help="With -n, group tests per browser and balance the groups by recorded durations"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--browser-affinity") and worker_count(config):
+        # Set on controller and workers: workers append "@group" to nodeids, the controller schedules by it
+        config.option.dist = "loadgroup"
+        config.option.loadgroup = True
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    workers = worker_count(config)
+    if not config.getoption("--browser-affinity") or not workers:
+        return
+
+    groups = assign_groups(items, config.duration_history, workers)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=groups[item.nodeid]))
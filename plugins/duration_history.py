@@ -0,0 +1,162 @@
+"""
+Per-test duration history across runs.
+
+The controller records setup+call+teardown time of every test into a compact
+JSON file ({"<nodeid>|<browser>": [seconds, ...]}, last WINDOW runs). The
+history gives a rolling median and p95 per test and browser, which is used to:
+
+  * run tests longest-first on xdist workers, so the slowest tests don't start last
+  * --durations-budget[=FACTOR]: fail a test whose runtime exceeds FACTOR x its p95
+
+A budget of exactly p95 would fail about one healthy run in twenty by
+definition, so the default factor leaves BUDGET_FACTOR headroom above it.
+"""
+import json
+import os
+import statistics
+import pytest
+from utils.nodes import base_nodeid, item_browser
+from utils.stats import percentile
+
+HISTORY_FILE = ".test_history.json"
+WINDOW = 20
+MIN_SAMPLES = 5
+BUDGET_FACTOR = 1.3
+
+
+def history_key(nodeid, browser):
+    return f"{base_nodeid(nodeid)}|{browser}"
+
+
+class DurationHistory:
+    def __init__(self, path=HISTORY_FILE, window=WINDOW):
+        self.path = path
+        self.window = window
+        self.samples = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                self.samples = json.load(f)
+        except (OSError, ValueError):
+            self.samples = {}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.samples, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, key, seconds):
+        samples = self.samples.setdefault(key, [])
+        samples.append(round(seconds, 3))
+        del samples[:-self.window]
+
+    def median(self, key, default=None):
+        samples = self.samples.get(key)
+        return statistics.median(samples) if samples else default
+
+    def p95(self, key, default=None):
+        samples = self.samples.get(key)
+        return percentile(samples, 95) if samples else default
+
+    def count(self, key):
+        return len(self.samples.get(key, []))
+
+
+class HistoryRecorder:
+    """Runs on the controller only (or a plain non-xdist run)"""
+
+    def __init__(self, history):
+        self.history = history
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        key = history_key(report.nodeid, dict(report.user_properties).get("browser", "nobrowser"))
+        self.durations[key] = self.durations.get(key, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations:
+            return
+        for key, seconds in self.durations.items():
+            self.history.record(key, seconds)
+        self.history.save()
+
+
+class DurationBudget:
+    """Fails a test at teardown when its total runtime exceeds factor x historical p95"""
+
+    def __init__(self, history, factor):
+        self.history = history
+        self.factor = factor
+        self.elapsed = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        rep = outcome.get_result()
+        elapsed = self.elapsed.get(item.nodeid, 0.0) + call.duration
+        self.elapsed[item.nodeid] = elapsed
+
+        if rep.when != "teardown" or not rep.passed:
+            return
+
+        key = history_key(item.nodeid, item_browser(item))
+        if self.history.count(key) < MIN_SAMPLES:
+            return
+
+        budget = self.history.p95(key) * self.factor
+        if elapsed > budget:
+            rep.outcome = "failed"
+            rep.longrepr = (
+                f"Duration budget exceeded: {elapsed:.2f}s > {budget:.2f}s "
+                f"(p95 {self.history.p95(key):.2f}s x {self.factor}, "
+                f"median {self.history.median(key):.2f}s over {self.history.count(key)} runs)"
+            )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--durations-budget",
+        action="store",
+        nargs="?",
+        type=float,
+        const=BUDGET_FACTOR,
+        default=None,
+        metavar="FACTOR",
+        help=f"Fail tests slower than FACTOR x their historical p95 (default factor {BUDGET_FACTOR})"
+    )
+
+
+def pytest_configure(config):
+    history = DurationHistory(os.path.join(str(config.rootpath), HISTORY_FILE))
+    config.duration_history = history
+
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(HistoryRecorder(history), "history_recorder")
+
+    factor = config.getoption("--durations-budget")
+    if factor is not None:
+        config.pluginmanager.register(DurationBudget(history, factor), "duration_budget")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Tag reports with the browser so the controller can key the history without collecting"""
+    outcome = yield
+    outcome.get_result().user_properties.append(("browser", item_browser(item)))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Longest-first order when running under xdist (same order on every worker)"""
+    if not (getattr(config, "workerinput", None) or config.getoption("numprocesses", default=0)):
+        return
+
+    history = config.duration_history
+    default = statistics.median(
+        [history.median(key) for key in history.samples] or [0.0]
+    )
+    items.sort(
+        key=lambda item: -history.median(history_key(item.nodeid, item_browser(item)), default)
+    )
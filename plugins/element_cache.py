@@ -0,0 +1,55 @@
+"""
+Hit/miss summary of the page-object element cache (utils/element_cache.py).
+
+Every test's cache hits and misses travel on report.user_properties, so
+the summary also works under pytest-xdist. The tests with the most misses
+are listed, they are the ones still paying a find_elements round-trip per
+lookup.
+"""
+import pytest
+from utils.element_cache import ElementCache
+
+MOST_MISSES = 5
+
+
+class ElementCacheReport:
+    def __init__(self):
+        self.before = None
+        self.counts = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.before = ElementCache.totals()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        rep = outcome.get_result()
+        if call.when != "teardown" or self.before is None:
+            return
+        totals = ElementCache.totals()
+        delta = {key: totals[key] - self.before[key] for key in totals}
+        if any(delta.values()):
+            rep.user_properties.append(("element_cache", delta))
+
+    def pytest_runtest_logreport(self, report):
+        delta = dict(report.user_properties).get("element_cache")
+        if delta:
+            self.counts[report.nodeid] = delta
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.counts:
+            return
+        hits = sum(delta["hits"] for delta in self.counts.values())
+        misses = sum(delta["misses"] for delta in self.counts.values())
+        tr = terminalreporter
+        tr.write_sep("-", "element cache")
+        tr.write_line(f"  {hits} hits, {misses} misses ({hits / (hits + misses) * 100:.1f}% hit rate)")
+        most = sorted(self.counts.items(), key=lambda entry: entry[1]["misses"], reverse=True)[:MOST_MISSES]
+        for nodeid, delta in most:
+            tr.write_line(f"  {delta['misses']:4d} misses / {delta['hits']:4d} hits  {nodeid}")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ElementCacheReport(), "element_cache_report")
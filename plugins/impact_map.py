@@ -0,0 +1,261 @@
+"""
+Test impact selection from a recorded page-object usage map.
+
+--record-impact profiles every test (setup, call and teardown) and records
+which functions under TRACED_DIRS it ran, e.g.
+"pages/checkout_page.py::CheckoutPage.click_finish". The map is merged
+into .impact_map.json by the controller at the end of the run.
+
+--changed-since REF selects tests from that map. Files changed between REF
+and the working tree are diffed line by line and mapped to the functions
+(or classes) they touch, and a test runs when:
+
+  * its own test file changed, or it is not in the map yet
+  * it ran a changed function, or a method of a changed class body
+  * it used a traced file whose module-level code changed
+
+Any other changed code or config file (conftest.py, plugins/, test_data.py,
+requirements.txt, ...) selects the whole suite, since its effect can't be
+traced. Docs and artifacts are ignored.
+"""
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+import pytest
+from utils.nodes import base_nodeid
+
+IMPACT_FILE = ".impact_map.json"
+TRACED_DIRS = ("pages/", "utils/")
+IGNORED_DIRS = ("screenshots/", "reports/", "allure-results/", ".idea/", ".github/")
+IGNORED_SUFFIXES = (".md", ".png", ".jpg", ".json", ".gitignore")
+HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def map_key(nodeid):
+    return base_nodeid(nodeid)
+
+
+def normalize(qualname):
+    """'CartPage.<lambda>' -> 'CartPage', 'A.f.<locals>.g' -> 'A.f'"""
+    return qualname.split(".<", 1)[0]
+
+
+class UsageRecorder:
+    """
+    sys.setprofile hook collecting 'file::qualname' of traced functions per test.
+    A profile function installed before (a profiler, coverage) keeps getting
+    every event and is put back after the test.
+    """
+
+    def __init__(self, rootdir):
+        self.rootdir = rootdir
+        self.files = {}
+        self.used = set()
+        self.previous = None
+
+    def relpath(self, filename):
+        if filename not in self.files:
+            rel = os.path.relpath(filename, self.rootdir).replace(os.sep, "/")
+            self.files[filename] = rel if rel.startswith(TRACED_DIRS) else None
+        return self.files[filename]
+
+    def profile(self, frame, event, arg):
+        if self.previous is not None:
+            self.previous(frame, event, arg)
+        if event != "call":
+            return
+        code = frame.f_code
+        rel = self.relpath(code.co_filename)
+        if rel:
+            self.used.add(f"{rel}::{normalize(getattr(code, 'co_qualname', code.co_name))}")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        outcome.get_result().user_properties.append(("impact", sorted(self.used)))
+        self.used = set()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.used = set()
+        self.previous = sys.getprofile()
+        sys.setprofile(self.profile)
+        try:
+            yield
+        finally:
+            sys.setprofile(self.previous)
+            self.previous = None
+
+
+class ImpactMapWriter:
+    """Merges the usage reported by every test into .impact_map.json (controller only)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.usage = {}
+
+    def pytest_runtest_logreport(self, report):
+        used = dict(report.user_properties).get("impact")
+        if used is not None:
+            self.usage.setdefault(map_key(report.nodeid), set()).update(used)
+
+    def pytest_sessionfinish(self, session):
+        if not self.usage:
+            return
+        impact_map = load_map(self.path)
+        impact_map.update({nodeid: sorted(used) for nodeid, used in self.usage.items()})
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(impact_map, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def load_map(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def git(rootdir, *args):
+    return subprocess.run(
+        ["git", *args], cwd=rootdir, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def changed_lines(rootdir, ref):
+    """{path: set of changed line numbers in the working tree}, deleted lines count as the line after them"""
+    changes = {}
+    path = None
+    for line in git(rootdir, "diff", "-U0", "--no-color", "--no-renames", ref, "--").splitlines():
+        if line.startswith("+++ "):
+            path = None if line == "+++ /dev/null" else line[len("+++ b/"):]
+            continue
+        if line.startswith("--- ") and line != "--- /dev/null":
+            # Deleted files only show up on the --- side
+            changes.setdefault(line[len("--- a/"):], set())
+            continue
+        match = HUNK.match(line)
+        if match and path:
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            changes.setdefault(path, set()).update(range(start, start + max(count, 1)))
+    for path in git(rootdir, "ls-files", "--others", "--exclude-standard").splitlines():
+        changes[path] = {0}
+    return changes
+
+
+def changed_symbols(source, lines):
+    """
+    Innermost function (or class body) containing each changed line, as qualnames.
+    '*' stands for module-level code.
+    """
+    spans = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                qualname = f"{prefix}{child.name}"
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                spans.append((start, child.end_lineno, qualname))
+                visit(child, qualname + ".")
+
+    visit(ast.parse(source), "")
+    symbols = set()
+    for line in lines:
+        enclosing = [span for span in spans if span[0] <= line <= span[1]]
+        symbols.add(max(enclosing, key=lambda span: span[0])[2] if enclosing else "*")
+    return symbols
+
+
+def affected(used, changes):
+    """True if any recorded 'file::qualname' is hit by changes ({file: symbols})"""
+    for entry in used:
+        path, _, qualname = entry.partition("::")
+        symbols = changes.get(path)
+        if symbols is None:
+            continue
+        if "*" in symbols or None in symbols:
+            return True
+        if any(qualname == symbol or qualname.startswith(symbol + ".") for symbol in symbols):
+            return True
+    return False
+
+
+def select(items, rootdir, ref, impact_map):
+    """(selected, deselected, reason) for items given the changes since ref"""
+    traced = {}
+    test_files = set()
+    for path, lines in changed_lines(rootdir, ref).items():
+        if path.startswith(IGNORED_DIRS) or path.endswith(IGNORED_SUFFIXES):
+            continue
+        if path.startswith("tests/"):
+            test_files.add(path)
+        elif path.startswith(TRACED_DIRS) and path.endswith(".py"):
+            full_path = os.path.join(rootdir, path)
+            if not os.path.exists(full_path) or 0 in lines:
+                traced[path] = {None}
+                continue
+            with open(full_path, encoding="utf-8") as f:
+                traced[path] = changed_symbols(f.read(), lines)
+        else:
+            return items, [], f"{path} changed, running everything"
+
+    selected, deselected = [], []
+    for item in items:
+        used = impact_map.get(map_key(item.nodeid))
+        test_file = item.nodeid.split("::", 1)[0]
+        if used is None or test_file in test_files or affected(used, traced):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    return selected, deselected, f"{len(traced)} traced files and {len(test_files)} test files changed"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help=f"Record which page-object/utils functions each test runs into {IMPACT_FILE}"
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="GIT_REF",
+        help=f"Only run tests affected by changes since GIT_REF, according to {IMPACT_FILE}"
+    )
+
+
+def pytest_configure(config):
+    rootdir = str(config.rootpath)
+    if config.getoption("--record-impact"):
+        config.pluginmanager.register(UsageRecorder(rootdir), "usage_recorder")
+        if not hasattr(config, "workerinput"):
+            config.pluginmanager.register(ImpactMapWriter(os.path.join(rootdir, IMPACT_FILE)), "impact_map_writer")
+
+
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("--changed-since")
+    if not ref:
+        return
+
+    rootdir = str(config.rootpath)
+    impact_map = load_map(os.path.join(rootdir, IMPACT_FILE))
+    if not impact_map:
+        print(f"\n [INFO] No {IMPACT_FILE}, run with --record-impact first; running everything")
+        return
+    try:
+        selected, deselected, reason = select(items, rootdir, ref, impact_map)
+    except (subprocess.CalledProcessError, OSError, SyntaxError) as e:
+        print(f"\n [INFO] Impact selection failed ({e.__class__.__name__}), running everything")
+        return
+
+    print(f"\n [INFO] --changed-since {ref}: {reason}, {len(selected)} selected, {len(deselected)} deselected")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -0,0 +1,53 @@
+"""
+@pytest.mark.matrix: parametrize a test from declarative dimensions (utils/matrix.py).
+
+    @pytest.mark.matrix(user=by_key(users, "username"), driver=["chrome", "firefox"], strategy="pairwise")
+    def test_something(user, driver): ...
+
+Every keyword except strategy/indirect is a dimension and an argument name.
+"driver" (the browser) is passed indirectly to the driver fixture unless
+indirect= says otherwise. --matrix-shard=I/N keeps only the cases whose id
+hashes to shard I of N, so CI jobs can split a large matrix evenly without
+collecting the cases they won't run.
+"""
+import pytest
+from utils.matrix import Matrix
+
+OPTIONS = ("strategy", "indirect")
+
+
+def shard_option(value):
+    index, _, count = value.partition("/")
+    index, count = int(index), int(count)
+    if not 0 <= index < count:
+        raise ValueError(f"shard index must be in 0..{count - 1}")
+    return index, count
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--matrix-shard",
+        action="store",
+        type=shard_option,
+        default=None,
+        metavar="I/N",
+        help="Only generate matrix cases in hash shard I of N (0-based)"
+    )
+
+
+def pytest_generate_tests(metafunc):
+    marker = metafunc.definition.get_closest_marker("matrix")
+    if marker is None:
+        return
+
+    dimensions = {name: values for name, values in marker.kwargs.items() if name not in OPTIONS}
+    indirect = marker.kwargs.get("indirect", [name for name in dimensions if name == "driver"])
+    matrix = Matrix(**dimensions)
+    metafunc.parametrize(
+        matrix.names,
+        [
+            pytest.param(*case.values.values(), id=case.id, marks=case.marks)
+            for case in matrix.cases(marker.kwargs.get("strategy", "all"), metafunc.config.getoption("--matrix-shard"))
+        ],
+        indirect=indirect
+    )
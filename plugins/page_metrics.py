@@ -0,0 +1,101 @@
+"""
+Navigation Timing / Web Vitals per test and per user.
+
+Tests that request the page_metrics fixture get a PageMetrics collector
+(utils/page_metrics.py) that page objects sample after every navigation they
+perform. Tests assert budgets on it:
+
+    page_metrics.assert_budget("inventory.html", user="standard_user", lcp_ms=2500)
+    page_metrics.slowdown("transition_ms", "inventory.html", "performance_glitch_user")
+
+With --page-metrics[=PATH] every test using a driver is sampled, and at session
+end the samples plus per-user, per-page medians are written to PATH (one file
+per xdist worker, "page_metrics.gw0.json"). Each test's samples are attached
+to Allure either way.
+"""
+import json
+import os
+import statistics
+import pytest
+from pages.base_page import BasePage
+from utils.lazy import allure
+from utils.page_metrics import PageMetrics
+
+DEFAULT_PATH = "page_metrics.json"
+
+
+def metrics_path(config):
+    path = config.getoption("--page-metrics")
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{workerinput['workerid']}{ext}"
+    return path
+
+
+def summarize(samples):
+    """{user: {page: {metric: median}}}"""
+    values = {}
+    for sample in samples:
+        pages = values.setdefault(sample["user"] or "anonymous", {})
+        for metric, value in sample["metrics"].items():
+            pages.setdefault(sample["page"], {}).setdefault(metric, []).append(value)
+    return {
+        user: {
+            page: {metric: round(statistics.median(v), 2) for metric, v in metrics.items()}
+            for page, metrics in pages.items()
+        }
+        for user, pages in values.items()
+    }
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--page-metrics",
+        action="store",
+        nargs="?",
+        const=DEFAULT_PATH,
+        default=None,
+        metavar="PATH",
+        help=f"Sample navigation/paint/resource timings in every test, export JSON (default {DEFAULT_PATH})"
+    )
+
+
+def pytest_configure(config):
+    config.page_metrics_samples = []
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.getoption("--page-metrics") or not config.page_metrics_samples:
+        return
+
+    with open(metrics_path(config), "w") as f:
+        json.dump(
+            {"summary": summarize(config.page_metrics_samples), "samples": config.page_metrics_samples},
+            f,
+            indent=2,
+            sort_keys=True
+        )
+
+
+@pytest.fixture
+def page_metrics(request, driver):
+    collector = PageMetrics(request.node.nodeid)
+    BasePage.page_metrics = collector
+    yield collector
+    BasePage.page_metrics = None
+
+    if collector.samples:
+        request.config.page_metrics_samples.extend(collector.samples)
+        allure.attach(
+            json.dumps(collector.samples, indent=2),
+            name="page metrics",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+@pytest.fixture(autouse=True)
+def _collect_page_metrics(request):
+    if request.config.getoption("--page-metrics") and "driver" in request.fixturenames:
+        request.getfixturevalue("page_metrics")
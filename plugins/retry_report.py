@@ -0,0 +1,90 @@
+"""
+Action-level retries and failure classification.
+
+Page-object methods decorated with @retry_action (utils/retry.py) retry only
+themselves on stale elements, and once on a timeout when their effect can be
+confirmed, with exponential backoff, instead of failing the whole test. Every retry is attached to the test's Allure
+result and travels on report.user_properties, so the summary also works
+under pytest-xdist. A failing test is classified as stale / timeout / crash /
+failure; after a crash the driver fixture throws the browser away instead of
+resetting it for the next test.
+"""
+import json
+import pytest
+from utils import retry
+from utils.lazy import allure
+from utils.retry import RetryLog, classify
+
+
+class RetryReport:
+    def __init__(self):
+        self.retries = {}
+        self.failures = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        RetryLog.take()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        rep = outcome.get_result()
+
+        records = RetryLog.take()
+        if records:
+            rep.user_properties.append(("action_retries", records))
+            allure.attach(
+                json.dumps(records, indent=2),
+                name=f"action retries ({rep.when})",
+                attachment_type=allure.attachment_type.JSON
+            )
+
+        if rep.failed and call.excinfo is not None:
+            kind = classify(call.excinfo.value)
+            rep.user_properties.append(("failure_class", kind))
+            rep.sections.append(("failure class", kind))
+            if kind == "crash":
+                item.browser_crashed = True
+
+    def pytest_runtest_logreport(self, report):
+        properties = dict(report.user_properties)
+        for record in properties.get("action_retries", []):
+            key = (record["action"], record["kind"])
+            self.retries[key] = self.retries.get(key, 0) + 1
+        if "failure_class" in properties:
+            self.failures.setdefault(properties["failure_class"], []).append(report.nodeid)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.retries and not self.failures:
+            return
+
+        tr = terminalreporter
+        tr.write_sep("-", "retry report")
+        for (action, kind), count in sorted(self.retries.items(), key=lambda entry: -entry[1]):
+            tr.write_line(f"  {count:4d} x {kind:<8} {action}")
+        for kind, nodeids in sorted(self.failures.items()):
+            tr.write_line(f"  {len(nodeids)} failed as {kind}: {', '.join(nodeids)}")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--action-retries",
+        action="store",
+        type=int,
+        default=2,
+        help="Retries of a page-object action after a stale element or confirmable timeout (0 disables)"
+    )
+    parser.addoption(
+        "--retry-backoff",
+        action="store",
+        type=float,
+        default=0.5,
+        help="Seconds before the first action retry, doubled for each further one"
+    )
+
+
+def pytest_configure(config):
+    retry.policy["attempts"] = config.getoption("--action-retries") + 1
+    retry.policy["backoff"] = config.getoption("--retry-backoff")
+    config.pluginmanager.register(RetryReport(), "retry_report")
@@ -0,0 +1,137 @@
+"""
+Failure screenshots written off the test thread.
+
+A failing test's browser is captured once (get_screenshot_as_png). The
+bytes go to a ScreenshotWriter (utils/screenshots.py) that stores the image
+and writes the Allure attachment from a background thread, optionally
+downscaled (--screenshot-scale) or re-encoded as WebP
+(--screenshot-format=webp, needs Pillow). The writer is flushed at session
+end, before Allure and pytest finish.
+
+Images land in a content-addressed ArtifactStore under screenshots/ (one copy
+per unique image, a journal per run mapping nodeid -> image). At the end of
+the run the controller evicts runs older than --screenshot-max-age days and
+then the oldest runs until the store fits in --screenshot-max-mb. Runs still
+in progress elsewhere (parallel CI jobs on a shared directory) keep their
+journals and every image written since they started. A run marks itself live
+with its first screenshot, so a run without failures (or --collect-only, or
+an xdist process that saw none) creates nothing under screenshots/.
+"""
+import os
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.artifact_store import ArtifactStore, new_run_id
+from utils.screenshots import FORMATS, ScreenshotWriter
+
+SCREENSHOT_DIR = "screenshots"
+
+
+def run_id(config):
+    workerinput = getattr(config, "workerinput", None)
+    run = new_run_id()
+    return f"{run}_{workerinput['workerid']}" if workerinput else run
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--screenshot-format",
+        action="store",
+        choices=sorted(FORMATS),
+        default="png",
+        help="Failure screenshot format (webp needs Pillow)"
+    )
+    parser.addoption(
+        "--screenshot-scale",
+        action="store",
+        type=float,
+        default=1.0,
+        help="Downscale failure screenshots by this factor, e.g. 0.5 (needs Pillow)"
+    )
+    parser.addoption(
+        "--screenshot-max-mb",
+        action="store",
+        type=float,
+        default=200,
+        help="Evict the oldest runs' screenshots beyond this many MB"
+    )
+    parser.addoption(
+        "--screenshot-max-age",
+        action="store",
+        type=float,
+        default=14,
+        metavar="DAYS",
+        help="Evict screenshots of runs older than this many days"
+    )
+
+
+def pytest_configure(config):
+    config.screenshot_store = ArtifactStore(
+        os.path.join(str(config.rootpath), SCREENSHOT_DIR),
+        run_id=run_id(config),
+        max_bytes=config.getoption("--screenshot-max-mb") * 1024 * 1024,
+        max_age_days=config.getoption("--screenshot-max-age")
+    )
+    config.screenshot_writer = ScreenshotWriter(
+        config.screenshot_store,
+        config.getoption("--screenshot-format"),
+        config.getoption("--screenshot-scale")
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    config = session.config
+    config.screenshot_writer.flush()
+    config.screenshot_store.save_run()
+
+    # Workers have all finished (and saved) before the controller gets here
+    if not hasattr(config, "workerinput"):
+        config.screenshot_evicted = config.screenshot_store.evict()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    store = config.screenshot_store
+    evicted = getattr(config, "screenshot_evicted", None)
+    if not (store.stored or store.deduplicated) and not (evicted and (evicted[0] or evicted[1])):
+        return
+
+    runs, objects, kept = evicted or (0, 0, 0)
+    terminalreporter.write_line(
+        f" Screenshots: {store.stored} new, {store.deduplicated} duplicates; "
+        f"evicted {runs} runs / {objects} images, {kept / 1024 / 1024:.1f} MB kept"
+    )
+
+
+def pytest_unconfigure(config):
+    writer = config.screenshot_writer
+    writer.close()
+    for error in writer.errors:
+        print(f"[WARN] Screenshot not written: {error}")
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Screenshot on failure"""
+    outcome = yield
+    rep = outcome.get_result()
+
+    if rep.when != "call" or not rep.failed:
+        return
+
+    driver = item.funcargs.get("driver")
+    if not driver:
+        return
+
+    try:
+        png = driver.get_screenshot_as_png()
+    except WebDriverException as e:
+        print(f"[INFO] No failure screenshot for {item.name}: {e.__class__.__name__}")
+        return
+
+    listener = item.config.pluginmanager.get_plugin("allure_listener")
+    item.config.screenshot_writer.submit(
+        png,
+        item.nodeid,
+        reporter=listener.allure_logger if listener else None,
+        name=item.name
+    )
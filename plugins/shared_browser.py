@@ -0,0 +1,151 @@
+"""
+--shared-browser: many isolated sessions in one Chrome/Chromium process.
+
+The controller (or a plain run) launches one browser. Under pytest-xdist
+every worker attaches its own WebDriver session to it through the
+browser's debugger address. Each test then gets a fresh browser context
+with its own tab (utils/browser_contexts.py), which is disposed after the
+test - so there is no reset and no per-test launch, and a CI runner holds
+one browser process instead of one per worker. Tests pinned to Firefox
+keep their own browser. When the run's --browser isn't Chrome/Chromium the
+controller launches nothing, and the first test parametrized to Chrome
+launches a shared browser in its own process. A test classified as a
+crash (plugins/retry_report.py) drops the shared browser; the next test
+launches a fresh one in its process.
+
+--action-timings does not wrap context drivers: EventFiringWebDriver only
+accepts a real WebDriver, so these tests have no action timings.
+
+The browser_contexts fixture opens extra isolated sessions inside the
+test's browser, e.g. to drive several users side by side.
+"""
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.browser_contexts import BrowserContexts, ContextDriver
+from utils.driver_factory import BLOCKED_URLS, attach_driver, create_driver
+
+SHARED_BROWSERS = ("chrome", "chromium")
+
+
+def use_shared_browser(config, browser):
+    return config.getoption("--shared-browser") and browser.lower() in SHARED_BROWSERS
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=False,
+        help="Run Chrome/Chromium tests as isolated browser contexts of one browser process"
+    )
+
+
+def pytest_configure(config):
+    config.shared_browser_host = None
+    if hasattr(config, "workerinput") or not use_shared_browser(config, config.getoption("--browser")):
+        return
+    config.shared_browser_host = create_driver(config.getoption("--browser"), fast=config.getoption("--fast"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    host = node.config.shared_browser_host
+    if host:
+        node.workerinput["shared_browser"] = host.capabilities["goog:chromeOptions"]["debuggerAddress"]
+
+
+def pytest_unconfigure(config):
+    if config.shared_browser_host:
+        quit_quietly(config.shared_browser_host)
+
+
+def quit_quietly(driver):
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+
+
+class SharedBrowser:
+    """This process's BrowserContexts on the shared browser, attached or launched on first use"""
+
+    def __init__(self, config):
+        self.config = config
+        self.address = getattr(config, "workerinput", {}).get("shared_browser")
+        self.contexts = None
+
+    def get(self):
+        if self.contexts is None:
+            if self.address:
+                driver = attach_driver(self.address)
+            else:
+                if self.config.shared_browser_host is None:
+                    self.config.shared_browser_host = create_driver(
+                        SHARED_BROWSERS[0], fast=self.config.getoption("--fast")
+                    )
+                driver = self.config.shared_browser_host
+            self.contexts = BrowserContexts(driver)
+        return self.contexts
+
+    def discard(self):
+        """The browser crashed: forget it, the next get() launches a fresh one in this process"""
+        driver = self.contexts.driver
+        self.contexts = None
+        quit_quietly(driver)
+        if driver is self.config.shared_browser_host:
+            self.config.shared_browser_host = None
+        # The controller's browser is gone too, don't attach to it again
+        self.address = None
+
+    def close(self):
+        if self.contexts is None:
+            return
+        self.contexts.close_all()
+        if self.address:
+            # Only end this worker's chromedriver; the browser belongs to the controller
+            self.contexts.driver.service.stop()
+
+
+@pytest.fixture(scope="session")
+def shared_browser(request):
+    """SharedBrowser of this process (one per xdist worker)"""
+    shared = SharedBrowser(request.config)
+    yield shared
+    shared.close()
+
+
+def shared_context(request, fast):
+    """New isolated context of the shared browser for this test, disposed at teardown"""
+    shared = request.getfixturevalue("shared_browser")
+    contexts = shared.get()
+    context = contexts.new(blocked_urls=BLOCKED_URLS if fast else None)
+
+    def release():
+        if getattr(request.node, "browser_crashed", False):
+            shared.discard()
+        else:
+            contexts.close(context)
+
+    request.addfinalizer(release)
+    return context
+
+
+@pytest.fixture
+def browser_contexts(request, driver):
+    """
+    Extra isolated sessions next to `driver`, in the same browser process on Chrome:
+        alice = browser_contexts.new()
+    Firefox has no browser contexts over WebDriver, there each new() launches a browser.
+    """
+    browser = request.node.callspec.params.get("driver") if hasattr(request.node, "callspec") else None
+    host = getattr(driver, "wrapped_driver", driver)
+    if isinstance(host, ContextDriver):
+        # Share the window bookkeeping of the shared browser's session
+        contexts = host._contexts
+    else:
+        contexts = BrowserContexts(host, factory=create_driver, browser=browser or request.config.getoption("--browser"))
+
+    existing = list(contexts.open)
+    yield contexts
+    for context in [c for c in contexts.open if c not in existing]:
+        contexts.close(context)
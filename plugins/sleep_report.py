@@ -0,0 +1,78 @@
+"""
+Suite-level report of time spent in fixed time.sleep() calls.
+
+time.sleep is wrapped for the whole session. Sleeps issued from selenium
+itself (WebDriverWait polling) are not counted - only fixed sleeps written in
+page objects, fixtures and tests. The per-phase sleep time travels on
+report.user_properties so the summary also works under pytest-xdist.
+"""
+import sys
+import time
+import pytest
+
+_real_sleep = time.sleep
+
+
+class SleepReport:
+    def __init__(self):
+        self.pending = 0.0
+        self.slept = {}
+        self.durations = {}
+
+    def sleep(self, seconds):
+        caller = sys._getframe(1).f_globals.get("__name__", "")
+        if not caller.startswith("selenium"):
+            self.pending += seconds
+        _real_sleep(seconds)
+
+    def pytest_configure(self, config):
+        time.sleep = self.sleep
+
+    def pytest_unconfigure(self, config):
+        time.sleep = _real_sleep
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.pending = 0.0
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        rep = outcome.get_result()
+        rep.user_properties.append(("sleep_seconds", self.pending))
+        self.pending = 0.0
+
+    def pytest_runtest_logreport(self, report):
+        slept = dict(report.user_properties).get("sleep_seconds", 0.0)
+        self.slept[report.nodeid] = self.slept.get(report.nodeid, 0.0) + slept
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.durations:
+            return
+
+        total_time = sum(self.durations.values())
+        total_sleep = sum(self.slept.values())
+        sleepers = sorted(
+            (nodeid for nodeid, slept in self.slept.items() if slept > 0),
+            key=lambda nodeid: self.slept[nodeid],
+            reverse=True
+        )
+
+        tr = terminalreporter
+        tr.write_sep("-", "sleep report")
+        share = total_sleep / total_time * 100 if total_time else 0
+        tr.write_line(
+            f"{len(self.durations)} tests: {total_time:.2f}s total, "
+            f"{total_sleep:.2f}s in fixed sleeps ({share:.1f}%), "
+            f"{total_time - total_sleep:.2f}s working"
+        )
+        for nodeid in sleepers:
+            slept = self.slept[nodeid]
+            duration = self.durations[nodeid]
+            tr.write_line(f"  {slept:6.2f}s sleep / {duration:6.2f}s total  {nodeid}")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(SleepReport(), "sleep_report")
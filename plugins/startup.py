@@ -0,0 +1,280 @@
+"""
+Collection manifest and --startup-profile.
+
+Collection is mostly import time of the test modules and the page objects
+they pull in (Selenium itself is deferred, see utils/lazy.py). After every
+complete collection .collection_manifest.json records each test file's
+mtime, how long it took to collect, and the -k keywords and markers of its
+tests. The manifest only holds while the inputs that shape collection are
+unchanged (conftest.py, pytest.ini, test_data.py, plugins/, the matrix
+engine, --matrix-shard).
+
+When a run selects with -k or -m, a test file that is unchanged since the
+manifest and has no test matching the expressions is not imported at all.
+Under xdist every worker collects the whole suite, so each one skips it.
+Matching uses pytest's own -k/-m parser and keyword matcher, which are
+private (_pytest.mark). pytest is pinned in requirements.txt; on a pytest
+where they don't look as expected the manifest is neither used nor written
+and everything is collected.
+
+--startup-profile prints where startup time went, per process: plugins
+loaded to collection start, collection, the slowest modules, the files
+skipped from the manifest (with their recorded collection time, i.e. the
+time saved), and the import cost of deferred modules that collection no
+longer needed.
+"""
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+import pytest
+
+MANIFEST_FILE = ".collection_manifest.json"
+SHARED_INPUTS = ("conftest.py", "pytest.ini", "test_data.py", "plugins", "utils/matrix.py")
+DEFERRED_MODULES = ("selenium.webdriver",)
+SLOWEST_MODULES = 5
+
+LOADED_AT = time.perf_counter()
+
+
+def inputs_key(config):
+    """Hash of the mtimes of everything besides a test file that changes what it collects"""
+    rootdir = config.rootpath
+    parts = [f"shard={config.getoption('--matrix-shard', None)}"]
+    for name in SHARED_INPUTS:
+        path = rootdir / name
+        for source in sorted(path.glob("*.py")) if path.is_dir() else [path]:
+            try:
+                parts.append(f"{source.relative_to(rootdir).as_posix()}={source.stat().st_mtime_ns}")
+            except OSError:
+                parts.append(f"{name}=missing")
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def selection_api():
+    """(Expression, KeywordMatcher) from _pytest.mark if they look as expected, else None"""
+    try:
+        from _pytest.mark import KeywordMatcher
+        from _pytest.mark.expression import Expression
+    except ImportError:
+        return None
+    if not callable(getattr(Expression, "compile", None)) or not callable(getattr(KeywordMatcher, "from_item", None)):
+        return None
+    if "_names" not in getattr(KeywordMatcher, "__dataclass_fields__", {}):
+        return None
+    return Expression, KeywordMatcher
+
+
+def compile_selection(config, api):
+    """(keyword_expr, mark_expr) compiled with pytest's own parser, None when not selecting or unparsable"""
+    keyword = config.getoption("keyword")
+    markexpr = config.getoption("markexpr")
+    if not keyword and not markexpr:
+        return None
+    expression, _ = api
+    try:
+        return (
+            expression.compile(keyword) if keyword else None,
+            expression.compile(markexpr) if markexpr else None,
+        )
+    except Exception:
+        # pytest reports a bad expression itself; without a parser we just collect everything
+        return None
+
+
+def may_select(tests, selection, api):
+    """True if any recorded (keywords, markers) test can pass -k and -m"""
+    _, keyword_matcher = api
+    keyword_expr, mark_expr = selection
+    try:
+        for keywords, markers in tests:
+            if keyword_expr and not keyword_expr.evaluate(keyword_matcher(set(keywords))):
+                continue
+            # Marker kwargs (-m "mark(key=value)") aren't recorded, so they count as a match
+            if mark_expr and not mark_expr.evaluate(lambda name, **kwargs: name in markers):
+                continue
+            return True
+    except Exception:
+        # Private API changed under us: collect the file
+        return True
+    return False
+
+
+def item_entry(item, api):
+    _, keyword_matcher = api
+    return [sorted(keyword_matcher.from_item(item)._names), sorted({mark.name for mark in item.iter_markers()})]
+
+
+class CollectionManifest:
+    """Skips unchanged, unselected test files and rewrites the manifest after collection"""
+
+    def __init__(self, config, writer):
+        self.rootdir = config.rootpath
+        self.path = os.path.join(str(self.rootdir), MANIFEST_FILE)
+        self.writer = writer
+        self.key = inputs_key(config)
+        self.api = selection_api()
+        manifest = load_manifest(self.path)
+        self.files = manifest.get("files", {}) if manifest.get("key") == self.key and self.api else {}
+        self.selection = compile_selection(config, self.api) if self.api else None
+        self.tests = {}
+        self.skipped = {}
+        self.module_seconds = {}
+
+    def relpath(self, path):
+        return os.path.relpath(str(path), str(self.rootdir)).replace(os.sep, "/")
+
+    def pytest_ignore_collect(self, collection_path, config):
+        if self.selection is None or collection_path.suffix != ".py":
+            return None
+        rel = self.relpath(collection_path)
+        entry = self.files.get(rel)
+        if entry is None or entry["mtime"] != mtime(collection_path):
+            return None
+        if may_select(entry["tests"], self.selection, self.api):
+            return None
+        self.skipped[rel] = entry.get("collect_s", 0.0)
+        return True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        started = time.perf_counter()
+        yield
+        if isinstance(collector, pytest.Module):
+            self.module_seconds[self.relpath(collector.path)] = time.perf_counter() - started
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, items):
+        # Before -k/-m, --changed-since or anything else deselects
+        if not self.api:
+            return
+        try:
+            for item in items:
+                self.tests.setdefault(self.relpath(item.path), []).append(item_entry(item, self.api))
+        except (AttributeError, TypeError):
+            # Private API changed under us: stop using and writing the manifest
+            self.api = None
+
+    def pytest_collection_finish(self, session):
+        # The xdist controller doesn't collect, module_seconds stays empty there
+        if not self.writer or not self.api or session.testsfailed or not self.module_seconds:
+            return
+        files = {rel: entry for rel, entry in self.files.items() if rel in self.skipped}
+        for rel, seconds in self.module_seconds.items():
+            files[rel] = {
+                "mtime": mtime(self.rootdir / rel),
+                "collect_s": round(seconds, 4),
+                "tests": self.tests.get(rel, []),
+            }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": self.key, "files": files}, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class StartupProfile:
+    """Startup timings of this process, shipped to the xdist controller through workeroutput"""
+
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.collection_started = None
+        self.profile = None
+        self.workers = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        self.collection_started = time.perf_counter()
+        yield
+        collected = time.perf_counter()
+        if not self.manifest.module_seconds and not self.manifest.skipped:
+            return
+        # Measured after collection: this is what a run that never builds a driver saves
+        deferred = {}
+        for name in DEFERRED_MODULES:
+            if name in sys.modules:
+                deferred[name] = None
+                continue
+            started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+            deferred[name] = round(time.perf_counter() - started, 4)
+
+        self.profile = {
+            "startup_s": round(self.collection_started - LOADED_AT, 4),
+            "collection_s": round(collected - self.collection_started, 4),
+            "modules": {rel: round(s, 4) for rel, s in self.manifest.module_seconds.items()},
+            "skipped": self.manifest.skipped,
+            "deferred": deferred,
+        }
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["startup_profile"] = self.profile
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        profile = getattr(node, "workeroutput", {}).get("startup_profile")
+        if profile:
+            self.workers[node.gateway.id] = profile
+
+    def pytest_terminal_summary(self, terminalreporter):
+        profiles = self.workers or ({"main": self.profile} if self.profile else {})
+        if not profiles:
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "startup profile")
+        for name, profile in sorted(profiles.items()):
+            tr.write_line(
+                f"{name}: plugins loaded -> collection {profile['startup_s']:.2f}s, "
+                f"collection {profile['collection_s']:.2f}s ({len(profile['modules'])} modules)"
+            )
+            slowest = sorted(profile["modules"].items(), key=lambda item: item[1], reverse=True)[:SLOWEST_MODULES]
+            if slowest:
+                tr.write_line("  slowest: " + ", ".join(f"{rel} {s:.2f}s" for rel, s in slowest))
+            if profile["skipped"]:
+                tr.write_line(
+                    f"  skipped from {MANIFEST_FILE}: {len(profile['skipped'])} modules, "
+                    f"~{sum(profile['skipped'].values()):.2f}s saved"
+                )
+            for module, seconds in profile["deferred"].items():
+                if seconds is None:
+                    tr.write_line(f"  {module}: imported during startup")
+                else:
+                    tr.write_line(f"  {module}: deferred past collection, {seconds:.2f}s saved")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--startup-profile",
+        action="store_true",
+        default=False,
+        help=f"Report plugin load, collection and module import times, and what {MANIFEST_FILE} saved"
+    )
+
+
+def pytest_configure(config):
+    workerinput = getattr(config, "workerinput", None)
+    # Workers collect identical suites, one of them is enough to keep the manifest current
+    writer = workerinput is None or workerinput["workerid"] == "gw0"
+    manifest = CollectionManifest(config, writer)
+    config.pluginmanager.register(manifest, "collection_manifest")
+    if config.getoption("--startup-profile"):
+        config.pluginmanager.register(StartupProfile(manifest), "startup_profile")
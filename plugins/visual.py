@@ -0,0 +1,114 @@
+"""
+Visual regression checks against baseline screenshots (utils/visual.py).
+
+The `visual` fixture compares element screenshots with the baselines under
+--visual-baselines (default visual_baselines/<browser>/): perceptual hash
+first, NumPy pixel diff only when the hashes disagree, results cached per
+baseline. Baselines are only written with --update-baselines, which records
+missing ones and rewrites the rest. A test whose checks have no baseline is
+skipped rather than passed, so a fresh checkout never records its own
+rendering as correct. A mismatch attaches the capture and the baseline to
+Allure, and the terminal summary counts the checks by outcome (through
+report.user_properties, so it also works under pytest-xdist).
+"""
+import pytest
+from utils.lazy import allure
+from utils.nodes import item_browser
+from utils.visual import PASSING, VisualBaselines
+
+DEFAULT_DIR = "visual_baselines"
+
+
+class VisualCheck:
+    """Baseline checks of one test, names are scoped to its browser"""
+
+    def __init__(self, baselines, browser):
+        self.baselines = baselines
+        self.browser = browser
+        self.results = []
+
+    def check(self, name, png):
+        result = self.baselines.check(f"{self.browser}/{name}", png)
+        self.results.append(result)
+        if result.status == "mismatch":
+            allure.attach(png, name=f"{name} (actual)", attachment_type=allure.attachment_type.PNG)
+            allure.attach(
+                self.baselines.baseline(result.name),
+                name=f"{name} (baseline)",
+                attachment_type=allure.attachment_type.PNG
+            )
+        return result
+
+    def check_all(self, images, prefix):
+        """check() every {name: png} as prefix/name"""
+        return [self.check(f"{prefix}/{name}", png) for name, png in images.items()]
+
+    def verify(self):
+        """Fail on any mismatch, otherwise skip when a check had no baseline to compare with"""
+        failed = [
+            f"{result.name}: {result.status} (distance {result.distance}, diff {result.diff_ratio})"
+            for result in self.results if result.status not in ("missing", *PASSING)
+        ]
+        assert not failed, failed
+        missing = [result.name for result in self.results if result.status == "missing"]
+        if missing:
+            pytest.skip(f"No visual baseline for {', '.join(missing)}, record them with --update-baselines")
+
+
+class VisualReport:
+    def __init__(self):
+        self.counts = {}
+        self.mismatches = []
+
+    def pytest_runtest_logreport(self, report):
+        for name, status in dict(report.user_properties).get("visual", []):
+            self.counts[status] = self.counts.get(status, 0) + 1
+            if status == "mismatch":
+                self.mismatches.append(f"{report.nodeid}: {name}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.counts:
+            return
+        tr = terminalreporter
+        tr.write_sep("-", "visual checks")
+        tr.write_line("  " + ", ".join(f"{count} {status}" for status, count in sorted(self.counts.items())))
+        for mismatch in self.mismatches:
+            tr.write_line(f"  mismatch {mismatch}")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--visual-baselines",
+        action="store",
+        default=DEFAULT_DIR,
+        metavar="DIR",
+        help=f"Directory of visual baseline screenshots, one subdirectory per browser (default {DEFAULT_DIR})"
+    )
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Overwrite visual baselines with this run's screenshots"
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(VisualReport(), "visual_report")
+
+
+@pytest.fixture(scope="session")
+def visual_baselines(request):
+    baselines = VisualBaselines(
+        request.config.getoption("--visual-baselines"),
+        update=request.config.getoption("--update-baselines")
+    )
+    yield baselines
+    baselines.save()
+
+
+@pytest.fixture
+def visual(request, visual_baselines):
+    """VisualCheck for the running test; results go to the visual summary"""
+    check = VisualCheck(visual_baselines, item_browser(request.node))
+    yield check
+    request.node.user_properties.append(("visual", [(result.name, result.status) for result in check.results]))
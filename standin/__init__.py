@@ -0,0 +1 @@
+"""Local stand-in for www.saucedemo.com"""
\ No newline at end of file
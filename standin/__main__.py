@@ -0,0 +1,22 @@
+import argparse
+from standin.server import StandinServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the SauceDemo stand-in locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port)
+    print(f"[INFO] SauceDemo stand-in on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from pages.checkout_validation import CHECKOUT_FIELDS
+from standin.images import product_image
+from test_data import products, users
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Every page is rendered client-side by app.js from the same shell, like the real site
+PAGES = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+
+class StandinHandler(SimpleHTTPRequestHandler):
+    """Serves the shell page, static assets, the catalog and generated product images"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=STATIC_DIR, **kwargs)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+
+        if path in PAGES:
+            return self.send_file("index.html", "text/html; charset=utf-8")
+        if path == "/static/catalog.js":
+            return self.send_bytes(self.catalog_script(), "application/javascript")
+        if path.startswith("/static/media/"):
+            return self.send_media(path.rsplit("/", 1)[-1])
+        if path.startswith("/static/"):
+            self.path = path[len("/static"):]
+            return super().do_GET()
+
+        self.send_error(404)
+
+    def send_file(self, name, content_type):
+        with open(os.path.join(STATIC_DIR, name), "rb") as f:
+            self.send_bytes(f.read(), content_type)
+
+    def send_media(self, name):
+        product = next((p for p in products if p["image"] == name), None)
+        if product is None:
+            # problem_user images point here on purpose
+            return self.send_error(404)
+        self.send_bytes(product_image(product["id"]), "image/png", cache=True)
+
+    def send_bytes(self, body, content_type, cache=False):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if cache:
+            self.send_header("Cache-Control", "max-age=3600")
+        else:
+            self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def catalog_script(self):
+        return (
+            f"window.CATALOG = {json.dumps(products)};\n"
+            f"window.USERS = {json.dumps(users)};\n"
+            f"window.CHECKOUT_FIELDS = {json.dumps(CHECKOUT_FIELDS)};\n"
+        ).encode("utf-8")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandinServer:
+    """
+    Local stand-in for www.saucedemo.com on loopback, port 0 picks a free port.
+    Started by `pytest --local-server`, or standalone with `python -m standin`.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), StandinHandler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
@@ -0,0 +1,432 @@
+/*
+ * Stand-in for www.saucedemo.com. Renders every page client-side with the
+ * DOM contract the page objects rely on. The session lives in the
+ * "session-username" cookie and the cart in localStorage "cart-contents",
+ * just like the real site.
+ */
+(function () {
+    "use strict";
+
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var GLITCH_DELAY_MS = 3000;
+    var TAX_RATE_PERCENT = 8;
+    var BROKEN_IMAGE = "/static/media/sl-404.png";
+
+    var SORTS = [
+        {value: "az", text: "Name (A to Z)"},
+        {value: "za", text: "Name (Z to A)"},
+        {value: "lohi", text: "Price (low to high)"},
+        {value: "hilo", text: "Price (high to low)"}
+    ];
+
+    var root = document.getElementById("root");
+
+    // ---- helpers ----
+
+    function el(tag, attrs, children) {
+        var node = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (name) {
+            if (name === "onclick" || name === "onchange" || name === "onsubmit") {
+                node[name] = attrs[name];
+            } else {
+                node.setAttribute(name, attrs[name]);
+            }
+        });
+        (children || []).forEach(function (child) {
+            node.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+        });
+        return node;
+    }
+
+    function getUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+    }
+
+    function findUser(username) {
+        return window.USERS.filter(function (u) { return u.username === username; })[0];
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function product(id) {
+        return window.CATALOG.filter(function (p) { return p.id === id; })[0];
+    }
+
+    function cartProducts() {
+        return getCart().map(product).filter(Boolean);
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function cents(price) {
+        return Math.round(parseFloat(price) * 100);
+    }
+
+    function money(amount) {
+        return "$" + (amount / 100).toFixed(2);
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    function imageSrc(p) {
+        return getUser() === "problem_user" ? BROKEN_IMAGE : "/static/media/" + p.image;
+    }
+
+    function busyWait(ms) {
+        // performance_glitch_user blocks the main thread, like the real site
+        var end = Date.now() + ms;
+        while (Date.now() < end) { /* spin */ }
+    }
+
+    // ---- shared widgets ----
+
+    function cartBadge() {
+        var count = getCart().length;
+        return count ? el("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge"}, [String(count)]) : null;
+    }
+
+    function refreshBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        var old = link.querySelector(".shopping_cart_badge");
+        if (old) { link.removeChild(old); }
+        var badge = cartBadge();
+        if (badge) { link.appendChild(badge); }
+    }
+
+    function header(title, extra) {
+        var link = el("a", {"class": "shopping_cart_link", "data-test": "shopping-cart-link", "href": "/cart.html"});
+        var badge = cartBadge();
+        if (badge) { link.appendChild(badge); }
+        return el("div", {"id": "header_container", "class": "header_container"}, [
+            el("div", {"class": "primary_header"}, [el("div", {"class": "app_logo"}, ["Swag Labs"]), link]),
+            el("div", {"class": "header_secondary_container"}, [
+                el("span", {"class": "title", "data-test": "title"}, [title])
+            ].concat(extra ? [extra] : []))
+        ]);
+    }
+
+    function setCartButton(button, p) {
+        var inCart = getCart().indexOf(p.id) !== -1;
+        button.id = (inCart ? "remove-" : "add-to-cart-") + slug(p.name);
+        button.setAttribute("data-test", button.id);
+        button.className = "btn " + (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+        button.textContent = inCart ? "Remove" : "Add to cart";
+    }
+
+    function cartButton(p) {
+        var button = el("button", {});
+        button.onclick = function () {
+            var cart = getCart();
+            var index = cart.indexOf(p.id);
+            if (index === -1) { cart.push(p.id); } else { cart.splice(index, 1); }
+            setCart(cart);
+            setCartButton(button, p);
+            refreshBadge();
+        };
+        setCartButton(button, p);
+        return button;
+    }
+
+    function showError(container, message, inputs) {
+        container.innerHTML = "";
+        container.className = "error-message-container error";
+        var close = el("button", {"class": "error-button", "data-test": "error-button", "aria-label": "close"});
+        close.onclick = function (event) {
+            event.preventDefault();
+            container.innerHTML = "";
+            container.className = "error-message-container";
+            inputs.forEach(function (input) { input.classList.remove("error"); });
+        };
+        container.appendChild(el("h3", {"data-test": "error"}, [message, close]));
+        inputs.forEach(function (input) { input.classList.add("error"); });
+    }
+
+    function cartItem(p, withButton) {
+        var pricebar = el("div", {"class": "item_pricebar"}, [
+            el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price"}, [money(cents(p.price))])
+        ]);
+        if (withButton) {
+            var remove = el("button", {
+                "class": "btn btn_secondary btn_small cart_button",
+                "id": "remove-" + slug(p.name),
+                "data-test": "remove-" + slug(p.name)
+            }, ["Remove"]);
+            remove.onclick = function () {
+                setCart(getCart().filter(function (id) { return id !== p.id; }));
+                item.parentNode.removeChild(item);
+                refreshBadge();
+            };
+            pricebar.appendChild(remove);
+        }
+        var item = el("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+            el("div", {"class": "cart_quantity", "data-test": "item-quantity"}, ["1"]),
+            el("div", {"class": "cart_item_label"}, [
+                el("a", {"href": "/inventory-item.html?id=" + p.id, "id": "item_" + p.id + "_title_link"}, [
+                    el("div", {"class": "inventory_item_name", "data-test": "inventory-item-name"}, [p.name])
+                ]),
+                el("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc"}, [p.description]),
+                pricebar
+            ])
+        ]);
+        return item;
+    }
+
+    function cartList(withButtons) {
+        return el("div", {"class": "cart_list", "data-test": "cart-list"}, [
+            el("div", {"class": "cart_quantity_label"}, ["QTY"]),
+            el("div", {"class": "cart_desc_label"}, ["Description"])
+        ].concat(cartProducts().map(function (p) { return cartItem(p, withButtons); })));
+    }
+
+    // ---- pages ----
+
+    function renderLogin(initialError) {
+        var username = el("input", {"class": "input_error form_input", "id": "user-name", "name": "user-name", "data-test": "username", "type": "text", "placeholder": "Username"});
+        var password = el("input", {"class": "input_error form_input", "id": "password", "name": "password", "data-test": "password", "type": "password", "placeholder": "Password"});
+        var error = el("div", {"class": "error-message-container"});
+        var form = el("form", {}, [
+            username,
+            password,
+            error,
+            el("input", {"type": "submit", "class": "submit-button btn_action", "id": "login-button", "name": "login-button", "data-test": "login-button", "value": "Login"})
+        ]);
+
+        form.onsubmit = function (event) {
+            event.preventDefault();
+            var user = findUser(username.value);
+            if (!username.value) {
+                return showError(error, "Epic sadface: Username is required", [username, password]);
+            }
+            if (!password.value) {
+                return showError(error, "Epic sadface: Password is required", [username, password]);
+            }
+            if (!user || user.password !== password.value) {
+                return showError(error, "Epic sadface: Username and password do not match any user in this service", [username, password]);
+            }
+            if (user.expected_behavior === "locked_out") {
+                return showError(error, "Epic sadface: Sorry, this user has been locked out.", [username, password]);
+            }
+            if (user.expected_behavior === "slow") {
+                busyWait(GLITCH_DELAY_MS);
+            }
+            setUser(user.username);
+            go("/inventory.html");
+        };
+
+        root.appendChild(el("div", {"class": "login_wrapper"}, [
+            el("div", {"class": "login_logo"}, ["Swag Labs"]),
+            form
+        ]));
+        if (initialError) {
+            showError(error, initialError, [username, password]);
+        }
+    }
+
+    function inventoryItem(p) {
+        return el("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+            el("div", {"class": "inventory_item_img"}, [
+                el("a", {"href": "/inventory-item.html?id=" + p.id, "id": "item_" + p.id + "_img_link"}, [
+                    el("img", {"alt": p.name, "class": "inventory_item_img", "src": imageSrc(p)})
+                ])
+            ]),
+            el("div", {"class": "inventory_item_description"}, [
+                el("div", {"class": "inventory_item_label"}, [
+                    el("a", {"href": "/inventory-item.html?id=" + p.id, "id": "item_" + p.id + "_title_link"}, [
+                        el("div", {"class": "inventory_item_name", "data-test": "inventory-item-name"}, [p.name])
+                    ]),
+                    el("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc"}, [p.description])
+                ]),
+                el("div", {"class": "pricebar"}, [
+                    el("div", {"class": "inventory_item_price", "data-test": "inventory-item-price"}, [money(cents(p.price))]),
+                    cartButton(p)
+                ])
+            ])
+        ]);
+    }
+
+    function sortedCatalog(order) {
+        var items = window.CATALOG.slice();
+        items.sort(function (a, b) {
+            if (order === "za") { return a.name < b.name ? 1 : -1; }
+            if (order === "lohi") { return cents(a.price) - cents(b.price) || (a.name < b.name ? -1 : 1); }
+            if (order === "hilo") { return cents(b.price) - cents(a.price) || (a.name < b.name ? -1 : 1); }
+            return a.name < b.name ? -1 : 1;
+        });
+        return items;
+    }
+
+    function renderInventory() {
+        var list = el("div", {"class": "inventory_list", "data-test": "inventory-list"});
+        var select = el("select", {"class": "product_sort_container", "data-test": "product-sort-container"},
+            SORTS.map(function (s) { return el("option", {"value": s.value}, [s.text]); }));
+
+        function fill() {
+            list.innerHTML = "";
+            sortedCatalog(select.value).forEach(function (p) { list.appendChild(inventoryItem(p)); });
+        }
+
+        select.onchange = fill;
+        root.appendChild(header("Products", select));
+        root.appendChild(el("div", {"class": "inventory_container", "id": "inventory_container"}, [list]));
+        fill();
+    }
+
+    function renderItem() {
+        var id = parseInt(new URLSearchParams(window.location.search).get("id"), 10);
+        var p = product(id);
+        var back = el("button", {"class": "btn btn_secondary back btn_large inventory_details_back_button", "id": "back-to-products", "data-test": "back-to-products"}, ["Back to products"]);
+        back.onclick = function () { go("/inventory.html"); };
+
+        root.appendChild(header("", back));
+        if (!p) {
+            root.appendChild(el("div", {"class": "inventory_details_name large_size"}, ["ITEM NOT FOUND"]));
+            return;
+        }
+        root.appendChild(el("div", {"class": "inventory_details", "data-test": "inventory-container"}, [
+            el("img", {"alt": p.name, "class": "inventory_details_img", "src": imageSrc(p)}),
+            el("div", {"class": "inventory_details_desc_container"}, [
+                el("div", {"class": "inventory_details_name large_size", "data-test": "inventory-item-name"}, [p.name]),
+                el("div", {"class": "inventory_details_desc large_size", "data-test": "inventory-item-desc"}, [p.description]),
+                el("div", {"class": "inventory_details_price", "data-test": "inventory-item-price"}, [money(cents(p.price))]),
+                cartButton(p)
+            ])
+        ]));
+    }
+
+    function renderCart() {
+        var continueShopping = el("button", {"class": "btn btn_secondary back btn_medium", "id": "continue-shopping", "data-test": "continue-shopping"}, ["Continue Shopping"]);
+        var checkout = el("button", {"class": "btn btn_action btn_medium checkout_button", "id": "checkout", "data-test": "checkout"}, ["Checkout"]);
+        continueShopping.onclick = function () { go("/inventory.html"); };
+        checkout.onclick = function () { go("/checkout-step-one.html"); };
+
+        root.appendChild(header("Your Cart"));
+        root.appendChild(el("div", {"id": "cart_contents_container", "class": "cart_contents_container"}, [
+            cartList(true),
+            el("div", {"class": "cart_footer"}, [continueShopping, checkout])
+        ]));
+    }
+
+    function renderStepOne() {
+        var first = el("input", {"class": "input_error form_input", "id": "first-name", "name": "firstName", "data-test": "firstName", "type": "text", "placeholder": "First Name"});
+        var last = el("input", {"class": "input_error form_input", "id": "last-name", "name": "lastName", "data-test": "lastName", "type": "text", "placeholder": "Last Name"});
+        var postal = el("input", {"class": "input_error form_input", "id": "postal-code", "name": "postalCode", "data-test": "postalCode", "type": "text", "placeholder": "Zip/Postal Code"});
+        var error = el("div", {"class": "error-message-container"});
+        var cancel = el("button", {"class": "btn btn_secondary back btn_medium cart_cancel_link", "id": "cancel", "data-test": "cancel"}, ["Cancel"]);
+        var form = el("form", {}, [
+            el("div", {"class": "checkout_info"}, [first, last, postal, error]),
+            el("div", {"class": "checkout_buttons"}, [
+                cancel,
+                el("input", {"type": "submit", "class": "submit-button btn btn_primary cart_button btn_action", "id": "continue", "name": "continue", "data-test": "continue", "value": "Continue"})
+            ])
+        ]);
+
+        cancel.onclick = function (event) {
+            event.preventDefault();
+            go("/cart.html");
+        };
+        form.onsubmit = function (event) {
+            event.preventDefault();
+            var inputs = [first, last, postal];
+            // Rules come from pages/checkout_validation.py: first empty field wins
+            for (var i = 0; i < window.CHECKOUT_FIELDS.length; i++) {
+                var field = window.CHECKOUT_FIELDS[i];
+                if (!document.getElementById(field[0]).value) {
+                    return showError(error, "Error: " + field[1] + " is required", inputs);
+                }
+            }
+            go("/checkout-step-two.html");
+        };
+
+        root.appendChild(header("Checkout: Your Information"));
+        root.appendChild(el("div", {"id": "checkout_info_container", "class": "checkout_info_container"}, [form]));
+    }
+
+    function renderStepTwo() {
+        var subtotal = cartProducts().reduce(function (sum, p) { return sum + cents(p.price); }, 0);
+        var tax = Math.round(subtotal * TAX_RATE_PERCENT / 100);
+        var cancel = el("button", {"class": "btn btn_secondary back btn_medium cart_cancel_link", "id": "cancel", "data-test": "cancel"}, ["Cancel"]);
+        var finish = el("button", {"class": "btn btn_action btn_medium cart_button", "id": "finish", "data-test": "finish"}, ["Finish"]);
+        cancel.onclick = function () { go("/inventory.html"); };
+        finish.onclick = function () {
+            setCart([]);
+            go("/checkout-complete.html");
+        };
+
+        root.appendChild(header("Checkout: Overview"));
+        root.appendChild(el("div", {"id": "checkout_summary_container", "class": "checkout_summary_container"}, [
+            cartList(false),
+            el("div", {"class": "summary_info"}, [
+                el("div", {"class": "summary_info_label", "data-test": "payment-info-label"}, ["Payment Information:"]),
+                el("div", {"class": "summary_value_label", "data-test": "payment-info-value"}, ["SauceCard #31337"]),
+                el("div", {"class": "summary_info_label", "data-test": "shipping-info-label"}, ["Shipping Information:"]),
+                el("div", {"class": "summary_value_label", "data-test": "shipping-info-value"}, ["Free Pony Express Delivery!"]),
+                el("div", {"class": "summary_info_label", "data-test": "total-info-label"}, ["Price Total"]),
+                el("div", {"class": "summary_subtotal_label", "data-test": "subtotal-label"}, ["Item total: " + money(subtotal)]),
+                el("div", {"class": "summary_tax_label", "data-test": "tax-label"}, ["Tax: " + money(tax)]),
+                el("div", {"class": "summary_info_label summary_total_label", "data-test": "total-label"}, ["Total: " + money(subtotal + tax)]),
+                el("div", {"class": "cart_footer"}, [cancel, finish])
+            ])
+        ]));
+    }
+
+    function renderComplete() {
+        var back = el("button", {"class": "btn btn_primary btn_small", "id": "back-to-products", "data-test": "back-to-products"}, ["Back Home"]);
+        back.onclick = function () { go("/inventory.html"); };
+
+        root.appendChild(header("Checkout: Complete!"));
+        root.appendChild(el("div", {"id": "checkout_complete_container", "class": "checkout_complete_container"}, [
+            el("h2", {"class": "complete-header", "data-test": "complete-header"}, ["Thank you for your order!"]),
+            el("div", {"class": "complete-text", "data-test": "complete-text"}, [
+                "Your order has been dispatched, and will arrive just as fast as the pony can get there!"
+            ]),
+            back
+        ]));
+    }
+
+    // ---- routing ----
+
+    var protectedPages = {
+        "/inventory.html": renderInventory,
+        "/inventory-item.html": renderItem,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderStepOne,
+        "/checkout-step-two.html": renderStepTwo,
+        "/checkout-complete.html": renderComplete
+    };
+
+    var path = window.location.pathname;
+    var page = protectedPages[path];
+
+    if (!page) {
+        renderLogin();
+    } else if (!getUser()) {
+        window.history.replaceState(null, "", "/");
+        renderLogin("Epic sadface: You can only access '" + path + "' when you are logged in.");
+    } else {
+        page();
+    }
+}());
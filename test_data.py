@@ -24,4 +24,82 @@ users = [
         "expected_behavior": "slow",
         "description": "User experiences slow performance"
     }
-]
\ No newline at end of file
+]
+
+# Inventory in the default "Name (A to Z)" order, ids as stored in localStorage "cart-contents"
+products = [
+    {
+        "id": 4,
+        "name": "Sauce Labs Backpack",
+        "price": "29.99",
+        "description": "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection.",
+        "image": "sauce-backpack-1200x1500.png"
+    },
+    {
+        "id": 0,
+        "name": "Sauce Labs Bike Light",
+        "price": "9.99",
+        "description": "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included.",
+        "image": "bike-light-1200x1500.png"
+    },
+    {
+        "id": 1,
+        "name": "Sauce Labs Bolt T-Shirt",
+        "price": "15.99",
+        "description": "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt.",
+        "image": "bolt-shirt-1200x1500.png"
+    },
+    {
+        "id": 5,
+        "name": "Sauce Labs Fleece Jacket",
+        "price": "49.99",
+        "description": "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office.",
+        "image": "sauce-pullover-1200x1500.png"
+    },
+    {
+        "id": 2,
+        "name": "Sauce Labs Onesie",
+        "price": "7.99",
+        "description": "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel.",
+        "image": "red-onesie-1200x1500.png"
+    },
+    {
+        "id": 3,
+        "name": "Test.allTheThings() T-Shirt (Red)",
+        "price": "15.99",
+        "description": "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton.",
+        "image": "red-tatt-1200x1500.png"
+    }
+]
+
+# Page budgets in ms for standard_user, medians from the page_metrics fixture
+page_budgets = {
+    "inventory.html": {"lcp_ms": 2500, "transition_ms": 3000},
+}
+
+# performance_glitch_user's login -> inventory transition vs standard_user's
+glitch_min_slowdown = 2.0
+
+# Input classes for the checkout-step-one validation matrix (every field x every class)
+checkout_field_values = {
+    "empty": "",
+    "plain": "Ibrahim",
+    "whitespace": "   ",
+    "padded": "  Ibrahim  ",
+    "long": "A" * 150,
+    "numbers": "Ibrahim123",
+    "unicode": "إبراهيم",
+    "special": "@#$%^&*",
+    "sql": "' OR '1'='1",
+    "xss": "<script>alert('XSS')</script>",
+}
+
+# Written from the real site, not from pages/checkout_validation.py: the error checkout-step-one
+# shows for each field, in the order it checks them, and the input classes it rejects.
+# Whitespace-only, long and any character set are accepted.
+checkout_required_errors = {
+    "first": "Error: First Name is required",
+    "last": "Error: Last Name is required",
+    "postal": "Error: Postal Code is required",
+}
+checkout_rejected_classes = {"empty"}
@@ -1,18 +1,15 @@
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
-from selenium.webdriver.common.by import By
+from utils.lazy import By
 
 
 @pytest.mark.parametrize("driver", ["firefox"], indirect=True)
+@pytest.mark.usefixtures("logged_in_driver")
 class TestCart:
     """Cart tests - Run on Firefox only"""
 
     def test_cart_loads(self, driver):
-        login = LoginPage(driver)
-        login.login("standard_user", "secret_sauce")
-
         products = ProductsPage(driver)
         products.add_product_to_cart(0)
         products.go_to_cart()
@@ -23,9 +20,6 @@ class TestCart:
         assert cart.get_items_count() == 1
 
     def test_remove_item_from_cart(self, driver):
-        login = LoginPage(driver)
-        login.login("standard_user", "secret_sauce")
-
         products = ProductsPage(driver)
         products.add_product_to_cart(0)
         products.go_to_cart()
@@ -38,9 +32,6 @@ class TestCart:
         assert cart.get_items_count() == 0
 
     def test_continue_shopping(self, driver):
-        login = LoginPage(driver)
-        login.login("standard_user", "secret_sauce")
-
         products = ProductsPage(driver)
         products.add_product_to_cart(0)
         products.go_to_cart()
@@ -53,9 +44,6 @@ class TestCart:
         assert "inventory.html" in driver.current_url
 
     def test_checkout_button(self, driver):
-        login = LoginPage(driver)
-        login.login("standard_user", "secret_sauce")
-
         products = ProductsPage(driver)
         products.add_product_to_cart(0)
         products.go_to_cart()
@@ -68,9 +56,6 @@ class TestCart:
         assert "checkout-step-one.html" in driver.current_url
 
     def test_cart_item_name_matches_products(self, driver):
-        login = LoginPage(driver)
-        login.login("standard_user", "secret_sauce")
-
         products = ProductsPage(driver)
 
         product_name = products.get_product_name(0)
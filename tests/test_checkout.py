@@ -1,14 +1,11 @@
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 
 @pytest.mark.parametrize("driver", ["firefox"], indirect=True)
+@pytest.mark.usefixtures("logged_in_driver")
 def test_checkout_flow(driver):
-    login = LoginPage(driver)
-    login.login("standard_user", "secret_sauce")
-
     products = ProductsPage(driver)
     products.add_product_to_cart(0)
     products.go_to_cart()
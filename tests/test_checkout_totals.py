@@ -0,0 +1,42 @@
+import time
+from decimal import ROUND_HALF_UP, Decimal
+from pages.checkout_state import CheckoutState
+from pages.checkout_totals import TotalsModel, every_cart
+from pages.models import CartItem, OrderSummary
+from test_data import products
+
+CARTS = every_cart([product["name"] for product in products])
+
+
+def summary_of(cart, subtotal, tax, total):
+    prices = {product["name"]: Decimal(product["price"]) for product in products}
+    return OrderSummary([CartItem(name, prices[name], "", 1) for name in cart], subtotal, tax, total)
+
+
+def test_totals_model_every_cart():
+    """Batch model against plain Decimal arithmetic for all 63 carts, no browser"""
+    model = TotalsModel(products)
+    started = time.process_time()
+    summaries = []
+    for cart in CARTS:
+        subtotal = sum(Decimal(p["price"]) for p in products if p["name"] in cart)
+        tax = (subtotal * Decimal("0.08")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        summaries.append(summary_of(cart, subtotal, tax, subtotal + tax))
+    assert model.verify(summaries, CARTS) == []
+    print(f" {len(CARTS)} carts verified in {(time.process_time() - started) * 1000:.1f} ms CPU")
+
+    # A one-cent error in any amount is reported
+    wrong = summary_of(CARTS[-1], *model.expected(CARTS[-1]))
+    wrong.tax += Decimal("0.01")
+    assert len(model.verify([wrong])) == 1
+
+
+def test_overview_totals_every_cart(driver):
+    """Every combination of the catalog seeded into the cart, one overview read each, verified in batch"""
+    summaries = []
+    for cart in CARTS:
+        indices = [i for i, product in enumerate(products) if product["name"] in cart]
+        summaries.append(CheckoutState(driver).with_products(*indices).at_step_two().get_order_summary())
+
+    problems = TotalsModel(products).verify(summaries, CARTS)
+    assert not problems, "\n".join(problems)
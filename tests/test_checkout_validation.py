@@ -0,0 +1,51 @@
+import pytest
+from pages.checkout_state import CheckoutState
+from pages.checkout_validation import CheckoutFormModel
+from test_data import checkout_field_values, checkout_rejected_classes, checkout_required_errors
+
+INPUT_CLASSES = list(checkout_field_values)
+
+# Browser cross-check: each required-field error plus a few of the inputs the site accepts
+BROWSER_SAMPLE = [
+    pytest.param("empty", "plain", "numbers", id="empty-first"),
+    pytest.param("plain", "empty", "numbers", id="empty-last"),
+    pytest.param("plain", "plain", "empty", id="empty-postal"),
+    pytest.param("whitespace", "whitespace", "whitespace", id="whitespace"),
+    pytest.param("long", "unicode", "special", id="long-unicode-special"),
+]
+
+
+def expected_error(classes):
+    """The real site's error for these input classes (first, last, postal), None when it accepts them"""
+    for field, input_class in zip(checkout_required_errors, classes):
+        if input_class in checkout_rejected_classes:
+            return checkout_required_errors[field]
+    return None
+
+
+def check_step_one(form, first, last, postal):
+    """Submit step one with the values of these input classes and compare with the expected outcome"""
+    form.fill_checkout_info(*(checkout_field_values[name] for name in (first, last, postal)))
+    form.submit_info()
+
+    error = expected_error((first, last, postal))
+    if error is None:
+        assert form.is_at_step_two(), f"Rejected valid input: {form.get_error_message()}"
+        assert form.get_error_message() == ""
+    else:
+        assert not form.is_at_step_two(), "Moved on to step two with an empty required field"
+        assert form.get_error_message() == error
+
+
+# Every combination of input classes over first name, last name and postal code
+@pytest.mark.matrix(first=INPUT_CLASSES, last=INPUT_CLASSES, postal=INPUT_CLASSES)
+def test_checkout_validation_model(first, last, postal):
+    """Whole input matrix against the validation model, no browser"""
+    check_step_one(CheckoutFormModel(), first, last, postal)
+
+
+@pytest.mark.parametrize("first, last, postal", BROWSER_SAMPLE)
+def test_checkout_validation_browser(driver, first, last, postal):
+    """Same assertions in a real browser, keeps the model and the expectations honest"""
+    checkout = CheckoutState(driver).with_products(0).at_step_one()
+    check_step_one(checkout, first, last, postal)
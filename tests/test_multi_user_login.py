@@ -1,41 +1,53 @@
 import pytest
-import os
 from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from test_data import glitch_min_slowdown, page_budgets, products, users
 
-test_data = [
-    ("standard_user", "secret_sauce", "Standard user with normal access"),
-    ("locked_out_user", "secret_sauce", "User account is locked out"),
-    ("problem_user", "secret_sauce", "User sees broken images"),
-    ("performance_glitch_user", "secret_sauce", "User experiences slow performance"),
-]
 
+@pytest.mark.needs_images
+def test_login_behavior(browser_contexts):
+    """Every user logs in side by side, each in an isolated context of one browser process"""
+    sessions = {}
+    for user in users:
+        session = browser_contexts.new()
+        login_page = LoginPage(session)
+        session.get(login_page.url())
+        login_page.login(user["username"], user["password"])
+        sessions[user["username"]] = (session, user["expected_behavior"])
 
-@pytest.mark.parametrize("username, password, expected_behavior", test_data)
-def test_login_behavior(driver, username, password, expected_behavior):
-    """Test different user login behaviors"""
+    for username, (session, behavior) in sessions.items():
+        login_page = LoginPage(session)
+
+        if behavior == "locked_out":
+            error_message = login_page.get_error_message()
+            assert "locked out" in error_message.lower(), f"Expected locked out error, got: {error_message}"
+            assert session.get_cookie("session-username") is None
+            continue
+
+        assert "inventory" in session.current_url, f"{username} should reach inventory"
+        assert session.get_cookie("session-username")["value"] == username, "Sessions leaked between contexts"
+
+        if behavior == "problematic_images":
+            # Pictures are compared with each other by perceptual hash, so this also runs headless in CI
+            broken = ProductsPage(session).broken_product_images()
+            assert len(broken) == len(products), f"Images should be broken for {username}, got {broken}"
+
+
+def test_inventory_within_page_budget(driver, page_metrics):
+    """standard_user's inventory page stays within its Web Vitals budget"""
+    LoginPage(driver).login_via_session("standard_user")
+    page_metrics.assert_budget("inventory.html", user="standard_user", **page_budgets["inventory.html"])
+
+
+def test_performance_glitch_user_slowdown(driver, page_metrics):
+    """performance_glitch_user reaches inventory measurably slower than standard_user"""
     login_page = LoginPage(driver)
-    login_page.login(username, password)
-
-    # Check if running in CI
-    is_ci = bool(os.getenv("CI") or os.getenv("GITHUB_ACTIONS"))
-
-    if expected_behavior == "Standard user with normal access":
-        assert "inventory" in driver.current_url, "Standard user should access inventory page"
-
-    elif expected_behavior == "User account is locked out":
-        error_message = login_page.get_error_message()
-        assert "locked out" in error_message.lower(), f"Expected locked out error, got: {error_message}"
-
-    elif expected_behavior == "User sees broken images":
-        #  Skip broken images check in CI/CD (headless mode)
-        if is_ci:
-            # Just verify login succeeded
-            assert "inventory" in driver.current_url, "Problem user should login successfully"
-            print(" Skipping broken images check in CI/CD (headless mode)")
-        else:
-            # Check broken images locally
-            assert "inventory" in driver.current_url
-            assert login_page.has_broken_images() == True, f"Images should be broken for {username}"
-
-    elif expected_behavior == "User experiences slow performance":
-        assert "inventory" in driver.current_url, "Performance user should eventually access inventory"
\ No newline at end of file
+    login_page.login("standard_user", "secret_sauce")
+
+    driver.delete_all_cookies()
+    driver.get(login_page.url())
+    login_page.login("performance_glitch_user", "secret_sauce")
+
+    slowdown = page_metrics.slowdown("transition_ms", "inventory.html", "performance_glitch_user")
+    assert slowdown is not None, f"Missing inventory samples: {page_metrics.samples}"
+    assert slowdown >= glitch_min_slowdown, f"performance_glitch_user only {slowdown:.1f}x slower"
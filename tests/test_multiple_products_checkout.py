@@ -1,20 +1,18 @@
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
-from selenium.webdriver.common.by import By
+from pages.checkout_totals import TotalsModel
+from test_data import products as catalog
+from utils.lazy import By
 
 
 @pytest.mark.parametrize("driver", ["firefox"], indirect=True)
+@pytest.mark.usefixtures("logged_in_driver")
 def test_multiple_products_checkout(driver):
     """
     Test checkout flow with multiple products
     """
-    #  Login
-    login = LoginPage(driver)
-    login.login("standard_user", "secret_sauce")
-
     products = ProductsPage(driver)
     products.wait_for_page_to_load()
 
@@ -45,23 +43,16 @@ def test_multiple_products_checkout(driver):
     print(f" Cart contains {cart_items_count} items")
 
     #  Verify product names in cart
-    cart_items = driver.find_elements(By.CLASS_NAME, "cart_item")
-    cart_product_names = [
-        item.find_element(By.CLASS_NAME, "inventory_item_name").text
-        for item in cart_items
-    ]
+    cart_items = cart.get_items()
+    cart_product_names = [item.name for item in cart_items]
 
     for product_name in selected_products:
         assert product_name in cart_product_names, f"Product '{product_name}' not found in cart!"
         print(f" Product '{product_name}' found in cart")
 
     #  Get product prices from cart
-    cart_prices = []
-    for item in cart_items:
-        price_text = item.find_element(By.CLASS_NAME, "inventory_item_price").text
-        # Remove '$' and convert to float
-        price = float(price_text.replace("$", ""))
-        cart_prices.append(price)
+    cart_prices = [item.price for item in cart_items]
+    for price in cart_prices:
         print(f"   Price: ${price}")
 
     expected_subtotal = sum(cart_prices)
@@ -81,38 +72,22 @@ def test_multiple_products_checkout(driver):
     print(" Reached checkout-step-two")
 
     #  Verify items on checkout overview page
-    overview_items = driver.find_elements(By.CLASS_NAME, "cart_item")
+    overview_items = checkout.get_overview_items()
     assert len(overview_items) == len(product_indices), f"Expected {len(product_indices)} items on overview"
     print(f" Overview shows {len(overview_items)} items")
 
     #  Verify prices on overview
-    overview_prices = []
-    for item in overview_items:
-        price_text = item.find_element(By.CLASS_NAME, "inventory_item_price").text
-        price = float(price_text.replace("$", ""))
-        overview_prices.append(price)
+    overview_prices = [item.price for item in overview_items]
 
     assert overview_prices == cart_prices, "Prices mismatch between cart and overview!"
     print(" All prices match between cart and overview")
 
-    #  Verify subtotal calculation
-    subtotal_text = driver.find_element(By.CLASS_NAME, "summary_subtotal_label").text
-    # Extract number from "Item total: $XX.XX"
-    subtotal_value = float(subtotal_text.split("$")[1])
-    assert subtotal_value == expected_subtotal, f"Subtotal mismatch! Expected ${expected_subtotal:.2f}, got ${subtotal_value:.2f}"
-    print(f" Subtotal verified: ${subtotal_value:.2f}")
-
-    #  Verify tax
-    tax_text = driver.find_element(By.CLASS_NAME, "summary_tax_label").text
-    tax_value = float(tax_text.split("$")[1])
-    print(f" Tax: ${tax_value:.2f}")
-
-    #  Verify total
-    total_text = driver.find_element(By.CLASS_NAME, "summary_total_label").text
-    total_value = float(total_text.split("$")[1])
-    expected_total = subtotal_value + tax_value
-    assert total_value == expected_total, f"Total mismatch! Expected ${expected_total:.2f}, got ${total_value:.2f}"
-    print(f" Total verified: ${total_value:.2f} (${subtotal_value:.2f} + ${tax_value:.2f})")
+    #  Verify item total, tax and total against the totals model
+    summary = checkout.get_order_summary()
+    assert summary.subtotal == expected_subtotal, f"Subtotal mismatch! Expected ${expected_subtotal:.2f}, got ${summary.subtotal:.2f}"
+    problems = TotalsModel(catalog).verify([summary], [selected_products])
+    assert not problems, "\n".join(problems)
+    print(f" Total verified: ${summary.total:.2f} (${summary.subtotal:.2f} + ${summary.tax:.2f})")
 
     #  Complete the order
     checkout.click_finish()
@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+from plugins.startup import DEFERRED_MODULES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_collection_defers_selenium():
+    """A separate --collect-only run imports none of DEFERRED_MODULES before collection ends, no browser"""
+    # addopts cleared: --clean-alluredir would wipe this run's results
+    run = subprocess.run(
+        [sys.executable, "-m", "pytest", "tests/", "--collect-only", "-q", "--startup-profile", "-o", "addopts="],
+        cwd=ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert run.returncode == 0, run.stdout + run.stderr
+    assert "startup profile" in run.stdout, run.stdout
+    for module in DEFERRED_MODULES:
+        assert f"{module}: imported during startup" not in run.stdout, run.stdout
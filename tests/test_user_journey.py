@@ -1,6 +1,5 @@
 import pytest
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utils.lazy import EC, WebDriverWait
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
@@ -15,10 +14,10 @@ def test_complete_user_journey_firefox(driver):
     assert login_page.is_logged_in() == True
 
     # 2. Go to products
-    driver.get("https://www.saucedemo.com/inventory.html")
+    products_page = ProductsPage(driver)
+    driver.get(products_page.url("inventory.html"))
 
     # 3. Add product to cart
-    products_page = ProductsPage(driver)
     products_page.add_product_to_cart(0)
     products_page.go_to_cart()
 
@@ -0,0 +1,39 @@
+import pytest
+from pages.checkout_state import CheckoutState
+from pages.products_page import ProductsPage
+from test_data import products
+
+
+@pytest.mark.needs_images
+def test_product_images_match_baselines(logged_in_driver, visual):
+    """Every product picture against its baseline, hash first, pixels only on a hash mismatch"""
+    images = ProductsPage(logged_in_driver).capture_product_images()
+    assert sorted(images) == sorted(product["name"] for product in products)
+
+    visual.check_all(images, "inventory")
+    visual.verify()
+
+
+@pytest.mark.needs_images
+def test_product_images_distinct(logged_in_driver):
+    """Headless-safe breakage check over all products at once, no baselines needed"""
+    broken = ProductsPage(logged_in_driver).broken_product_images()
+    assert broken == [], f"Broken or duplicated product pictures: {broken}"
+
+
+@pytest.mark.needs_images
+def test_checkout_steps_match_baselines(driver, visual):
+    checkout = CheckoutState(driver).with_products(0, 1).at_step_one()
+    visual.check("checkout/step-one", checkout.capture_step())
+
+    checkout.fill_checkout_info("Ibrahim", "Mohamed", "12345")
+    # Each step is captured only once it rendered: step_container also matches the previous step
+    checkout.submit_info()
+    assert checkout.is_at_step_two(), checkout.get_error_message()
+    checkout.wait_visible(checkout.finish_btn)
+    visual.check("checkout/step-two", checkout.capture_step())
+
+    checkout.click_finish()
+    assert checkout.is_checkout_complete()
+    visual.check("checkout/complete", checkout.capture_step())
+    visual.verify()
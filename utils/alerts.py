@@ -1,5 +1,4 @@
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utils.lazy import EC, WebDriverWait
 from selenium.common.exceptions import TimeoutException
 
 def accept_alert_if_present(driver, timeout=3):
@@ -0,0 +1,165 @@
+"""
+Compact Allure results: one gzip'd, line-delimited JSON stream per process.
+
+    {"type": "result", "file": "<uuid>-result.json", "data": {...}}
+    {"type": "container", "file": "<uuid>-container.json", "data": {...}}
+    {"type": "attachment", "file": "<uuid>-attachment.png", "base64": "..."}
+
+CompactAllureLogger replaces allure's AllureFileLogger (see
+plugins/allure_compact.py). The stream can be expanded back into a regular
+allure-results directory for `allure generate`, or summarized directly:
+
+    python -m utils.allure_compact summary allure-results
+    python -m utils.allure_compact expand allure-results --out allure-expanded
+"""
+import argparse
+import base64
+import glob
+import gzip
+import json
+import os
+import threading
+import uuid
+from attr import asdict
+from allure_commons import hookimpl
+
+STREAM_PATTERN = "results.{worker}.ndjson.gz"
+STATUSES = ["passed", "failed", "broken", "skipped", "unknown"]
+
+
+class CompactAllureLogger:
+    """Appends every result, container and attachment to one gzip stream (thread-safe)"""
+
+    def __init__(self, report_dir, worker="main"):
+        os.makedirs(report_dir, exist_ok=True)
+        self.path = os.path.join(report_dir, STREAM_PATTERN.format(worker=worker))
+        self.stream = gzip.open(self.path, "ab")
+        self.lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.stream.write(line.encode("utf-8"))
+
+    def report_item(self, kind, item):
+        self.write({
+            "type": kind,
+            "file": item.file_pattern.format(prefix=uuid.uuid4()),
+            "data": asdict(item, filter=lambda _, v: v or v is False),
+        })
+
+    @hookimpl
+    def report_result(self, result):
+        self.report_item("result", result)
+
+    @hookimpl
+    def report_container(self, container):
+        self.report_item("container", container)
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        with open(source, "rb") as f:
+            self.report_attached_data(f.read(), file_name)
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.write({"type": "attachment", "file": file_name, "base64": base64.b64encode(body).decode("ascii")})
+
+    def close(self):
+        with self.lock:
+            self.stream.close()
+
+
+def read_records(report_dir):
+    """Every record of every stream in report_dir, in write order per stream"""
+    for path in sorted(glob.glob(os.path.join(report_dir, STREAM_PATTERN.format(worker="*")))):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile):
+            # A worker that died mid-write leaves a truncated last member
+            continue
+
+
+def expand(report_dir, out_dir):
+    """Write the streams as regular allure-results files, return the number of files"""
+    os.makedirs(out_dir, exist_ok=True)
+    count = 0
+    for record in read_records(report_dir):
+        path = os.path.join(out_dir, record["file"])
+        if record["type"] == "attachment":
+            with open(path, "wb") as f:
+                f.write(base64.b64decode(record["base64"]))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(record["data"], f, ensure_ascii=False)
+        count += 1
+    return count
+
+
+def suite_of(result):
+    labels = {label["name"]: label["value"] for label in result.get("labels", [])}
+    return labels.get("suite") or labels.get("parentSuite") or result.get("fullName", "").rsplit("#", 1)[0]
+
+
+def summarize(report_dir, slowest=10):
+    """
+    Status counts and durations per suite, from results only.
+    A test reported more than once (reruns) counts with its last result.
+    """
+    latest = {}
+    for record in read_records(report_dir):
+        if record["type"] != "result":
+            continue
+        result = record["data"]
+        key = result.get("historyId") or result.get("fullName") or result["uuid"]
+        if key not in latest or result.get("stop", 0) >= latest[key].get("stop", 0):
+            latest[key] = result
+
+    totals = {status: 0 for status in STATUSES}
+    suites = {}
+    durations = []
+    for result in latest.values():
+        status = result.get("status", "unknown")
+        seconds = (result.get("stop", 0) - result.get("start", 0)) / 1000
+        totals[status] = totals.get(status, 0) + 1
+        suite = suites.setdefault(suite_of(result), {"tests": 0, "duration_s": 0.0, **{s: 0 for s in STATUSES}})
+        suite["tests"] += 1
+        suite["duration_s"] = round(suite["duration_s"] + seconds, 3)
+        suite[status] = suite.get(status, 0) + 1
+        durations.append((seconds, result.get("fullName", result.get("name", ""))))
+
+    durations.sort(reverse=True)
+    return {
+        "tests": len(latest),
+        "statuses": totals,
+        "duration_s": round(sum(seconds for seconds, _ in durations), 3),
+        "suites": suites,
+        "slowest": [{"test": name, "duration_s": round(seconds, 3)} for seconds, name in durations[:slowest]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize or expand compact Allure results")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary_parser = commands.add_parser("summary", help="Pass/fail/duration rollups as JSON")
+    summary_parser.add_argument("report_dir")
+    summary_parser.add_argument("--slowest", type=int, default=10)
+    expand_parser = commands.add_parser("expand", help="Write regular allure-results files")
+    expand_parser.add_argument("report_dir")
+    expand_parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        print(json.dumps(summarize(args.report_dir, args.slowest), indent=2))
+    else:
+        count = expand(args.report_dir, args.out)
+        print(f"[INFO] Wrote {count} files to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import glob
+import hashlib
+import json
+import os
+import time
+import uuid
+
+DAY = 24 * 60 * 60
+
+
+def new_run_id():
+    """Timestamp plus a random suffix: runs started in the same second (xdist, parallel CI jobs) stay apart"""
+    return f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def remove(path):
+    """Delete path if it is still there, a concurrent eviction may have removed it already"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for failure screenshots.
+
+        screenshots/objects/3f/3f9a...c1.png   one file per unique image (sha256 of the bytes)
+        screenshots/runs/<run id>.json         {"started": ts, "artifacts": {nodeid: "3f9a...c1.png"}}
+
+    Every process writes only its own run journal, so xdist workers never
+    share a file; objects are written atomically and are identical for the
+    same name. The first put() writes the journal without "finished"
+    (begin_run()) before the object, so other runs know this one is live; a
+    run that stores nothing never creates a file. evict() drops runs older than
+    max_age_days, then the oldest finished runs until the objects fit in
+    max_bytes, and deletes every object no remaining run points to - except
+    objects written since the oldest live run started, which that run may
+    not have journaled yet.
+    """
+
+    def __init__(self, root="screenshots", run_id=None, max_bytes=200 * 1024 * 1024, max_age_days=14):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.runs_dir = os.path.join(root, "runs")
+        self.run_id = run_id or new_run_id()
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.started = time.time()
+        self.artifacts = {}
+        self.begun = False
+        self.stored = 0
+        self.deduplicated = 0
+
+    def object_path(self, name):
+        return os.path.join(self.objects_dir, name[:2], name)
+
+    def put(self, body, extension, nodeid):
+        """Store body for nodeid in this run, return the object path"""
+        if not self.begun:
+            self.begin_run()
+        name = f"{hashlib.sha256(body).hexdigest()}.{extension}"
+        path = self.object_path(name)
+        if os.path.exists(path):
+            self.deduplicated += 1
+            # Keeps the object young for anything that looks at mtimes
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, body)
+            self.stored += 1
+
+        self.artifacts[nodeid] = name
+        return path
+
+    def journal_path(self, run_id=None):
+        return os.path.join(self.runs_dir, f"{run_id or self.run_id}.json")
+
+    def write_journal(self, finished=None):
+        os.makedirs(self.runs_dir, exist_ok=True)
+        journal = {"started": self.started, "finished": finished, "artifacts": self.artifacts}
+        write_atomic(self.journal_path(), json.dumps(journal, indent=2, sort_keys=True).encode("utf-8"))
+
+    def begin_run(self):
+        """Mark this run live, see evict()"""
+        self.write_journal()
+        self.begun = True
+
+    def save_run(self):
+        if not self.artifacts:
+            # Nothing to keep, only drop the live marker
+            remove(self.journal_path())
+            return
+        self.write_journal(finished=time.time())
+
+    def load_runs(self):
+        """{run id: journal}, unreadable journals are skipped"""
+        runs = {}
+        for path in glob.glob(os.path.join(self.runs_dir, "*.json")):
+            try:
+                with open(path) as f:
+                    runs[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+            except (OSError, ValueError):
+                continue
+        return runs
+
+    def objects(self):
+        """{object name: size in bytes}"""
+        return {name: stat.st_size for name, stat in self.object_stats().items()}
+
+    def object_stats(self):
+        """{object name: os.stat result}, objects deleted meanwhile are skipped"""
+        stats = {}
+        for path in glob.glob(os.path.join(self.objects_dir, "*", "*")):
+            if path.endswith(".tmp"):
+                continue
+            try:
+                stats[os.path.basename(path)] = os.stat(path)
+            except FileNotFoundError:
+                continue
+        return stats
+
+    def lookup(self, nodeid):
+        """Object paths recorded for nodeid, newest run first"""
+        runs = sorted(self.load_runs().values(), key=lambda run: run["started"], reverse=True)
+        return [
+            self.object_path(run["artifacts"][nodeid])
+            for run in runs
+            if nodeid in run["artifacts"]
+        ]
+
+    def evict(self, now=None):
+        """Apply age and size limits, return (runs removed, objects removed, bytes kept)"""
+        now = now or time.time()
+        runs = self.load_runs()
+        stats = self.object_stats()
+        sizes = {name: stat.st_size for name, stat in stats.items()}
+        # Live markers older than max_age_days belong to crashed runs and go with them
+        removed_runs = [
+            run_id for run_id, run in runs.items()
+            if now - run["started"] > self.max_age_days * DAY
+        ]
+        running = [
+            run_id for run_id, run in runs.items()
+            if run_id not in removed_runs and run_id != self.run_id and not run.get("finished")
+        ]
+
+        def referenced(run_ids):
+            return {name for run_id in run_ids for name in runs[run_id]["artifacts"].values()}
+
+        kept = sorted(
+            (run_id for run_id in runs if run_id not in removed_runs and run_id not in running),
+            key=lambda run_id: runs[run_id]["started"]
+        )
+        while kept and sum(sizes.get(name, 0) for name in referenced(kept + running)) > self.max_bytes:
+            removed_runs.append(kept.pop(0))
+
+        for run_id in removed_runs:
+            remove(self.journal_path(run_id))
+
+        live = referenced(kept + running)
+        # A live run may have written (or re-touched) an object it hasn't journaled yet
+        protected_since = min((runs[run_id]["started"] for run_id in running), default=None)
+        removed_objects = [
+            name for name in sizes
+            if name not in live and (protected_since is None or stats[name].st_mtime < protected_since)
+        ]
+        for name in removed_objects:
+            remove(self.object_path(name))
+
+        kept_names = set(sizes) - set(removed_objects)
+        return len(removed_runs), len(removed_objects), sum(sizes[name] for name in kept_names)
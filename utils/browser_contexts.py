@@ -0,0 +1,107 @@
+class ContextDriver:
+    """
+    A driver for one isolated browser context (own cookies, localStorage, cache).
+
+    Every attribute access first makes this context's tab the current window
+    of the underlying WebDriver session, so page objects can be handed a
+    ContextDriver like a normal driver. Elements found through one context
+    must be used before another context is driven.
+    """
+
+    def __init__(self, contexts, handle, context_id):
+        self._contexts = contexts
+        self.handle = handle
+        self.context_id = context_id
+        # This context's own count, see utils/element_cache.track_navigation
+        self.navigations = 0
+
+    def __getattr__(self, name):
+        self._contexts.activate(self.handle)
+        return getattr(self._contexts.driver, name)
+
+    def navigate(self, name, *args):
+        self.navigations += 1
+        return self.__getattr__(name)(*args)
+
+    def get(self, url):
+        return self.navigate("get", url)
+
+    def back(self):
+        return self.navigate("back")
+
+    def forward(self):
+        return self.navigate("forward")
+
+    def refresh(self):
+        return self.navigate("refresh")
+
+    def quit(self):
+        self._contexts.close(self)
+
+
+def supports_contexts(driver):
+    return hasattr(driver, "execute_cdp_cmd")
+
+
+class BrowserContexts:
+    """
+    Isolated sessions inside one Chrome/Chromium process, one browser context and tab each.
+
+    Contexts are created over CDP (Target.createBrowserContext) and disposed on
+    close(), which drops all their storage, so nothing has to be reset between
+    users. Firefox has no CDP: there new() falls back to launching a separate
+    browser with `factory`.
+    """
+
+    def __init__(self, driver, factory=None, browser="chrome"):
+        self.driver = driver
+        self.factory = factory
+        self.browser = browser
+        self.home = driver.current_window_handle
+        self.current = self.home
+        self.open = []
+
+    def activate(self, handle):
+        if self.current != handle:
+            self.driver.switch_to.window(handle)
+            self.current = handle
+
+    def new(self, blocked_urls=None):
+        if not supports_contexts(self.driver):
+            driver = self.factory(self.browser)
+            self.open.append(driver)
+            return driver
+
+        self.activate(self.home)
+        context_id = self.driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": True}
+        )["browserContextId"]
+        handle = self.driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+        )["targetId"]
+        context = ContextDriver(self, handle, context_id)
+        self.open.append(context)
+
+        if blocked_urls:
+            context.execute_cdp_cmd("Network.enable", {})
+            context.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+        return context
+
+    def close(self, context):
+        if context not in self.open:
+            return
+        self.open.remove(context)
+
+        if not isinstance(context, ContextDriver):
+            context.quit()
+            return
+
+        self.activate(context.handle)
+        self.driver.close()
+        self.current = None
+        self.activate(self.home)
+        self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context.context_id})
+
+    def close_all(self):
+        for context in list(self.open):
+            self.close(context)
@@ -0,0 +1,241 @@
+"""
+Per-machine cache of resolved driver/browser binaries and template browser profiles.
+
+Without it every launch asks Selenium Manager for chromedriver/geckodriver
+and the browser, and the driver builds a fresh profile from the options.
+DriverCache resolves each browser once and keeps the paths and versions in
+<cache dir>/drivers.json; an entry is resolved again when a binary is gone or
+has changed (browser auto-update). Resolution uses Selenium Manager and
+falls back to webdriver-manager.
+
+Template profiles hold the preferences the driver factory sets, one per
+distinct set of prefs (profiles/<browser>-<hash>/). A launch copies the
+template into a temp dir, which is removed when the driver quits (or, if it
+never does, once the driver object is gone).
+
+    python -m utils.driver_cache warm --browser chrome firefox
+    python -m utils.driver_cache show
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "saucedemo-automation")
+RESOLVED_FILE = "drivers.json"
+VERSION = re.compile(r"\d+(?:\.\d+)+")
+
+
+def cache_name(browser):
+    """Chromium runs through the Chrome driver path locally, see utils/driver_factory.py"""
+    return "firefox" if browser.lower() == "firefox" else "chrome"
+
+
+def stamp(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+def binary_version(path):
+    if not path:
+        return None
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION.search(output)
+    return match.group(0) if match else None
+
+
+def selenium_manager_paths(browser):
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+    return SeleniumManager().binary_paths(["--browser", browser])
+
+
+def webdriver_manager_paths(browser):
+    if browser == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return {"driver_path": GeckoDriverManager().install(), "browser_path": None}
+    from webdriver_manager.chrome import ChromeDriverManager
+    return {"driver_path": ChromeDriverManager().install(), "browser_path": None}
+
+
+def expand_prefs(prefs):
+    """{"profile.password_manager_enabled": False} -> {"profile": {"password_manager_enabled": False}}"""
+    nested = {}
+    for name, value in prefs.items():
+        *parents, leaf = name.split(".")
+        node = nested
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return nested
+
+
+def write_chrome_profile(path, prefs):
+    os.makedirs(os.path.join(path, "Default"))
+    with open(os.path.join(path, "Default", "Preferences"), "w") as f:
+        json.dump(expand_prefs(prefs), f)
+    # Chrome skips its first-run setup when this sentinel exists
+    open(os.path.join(path, "First Run"), "w").close()
+
+
+def write_firefox_profile(path, prefs):
+    os.makedirs(path)
+    with open(os.path.join(path, "user.js"), "w") as f:
+        for name, value in sorted(prefs.items()):
+            f.write(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n")
+
+
+PROFILE_WRITERS = {"chrome": write_chrome_profile, "firefox": write_firefox_profile}
+
+
+class DriverCache:
+    """Resolved binaries and template profiles under one directory, shared by workers and threads"""
+
+    def __init__(self, path=CACHE_DIR):
+        self.path = path
+        self.resolved_path = os.path.join(path, RESOLVED_FILE)
+        self.lock = threading.Lock()
+        self.entries = None
+        self.unresolved = set()
+
+    def load(self):
+        try:
+            with open(self.resolved_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        # Unique tmp name: xdist workers may resolve at the same time on a cold cache
+        tmp_path = f"{self.resolved_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.resolved_path)
+
+    def is_current(self, entry):
+        for kind in ("driver", "browser"):
+            path = entry.get(f"{kind}_path")
+            if path and stamp(path) != entry.get(f"{kind}_mtime"):
+                return False
+        return bool(entry.get("driver_path"))
+
+    def resolve(self, browser):
+        """{driver_path, driver_version, browser_path, browser_version}, or None if nothing resolves"""
+        name = cache_name(browser)
+        with self.lock:
+            if self.entries is None:
+                self.entries = self.load()
+            entry = self.entries.get(name)
+            if entry and self.is_current(entry):
+                return entry
+            if name in self.unresolved:
+                return None
+
+            paths = None
+            for resolver in (selenium_manager_paths, webdriver_manager_paths):
+                try:
+                    paths = resolver(name)
+                    break
+                except Exception as e:
+                    print(f"[INFO] {resolver.__name__}({name}) failed: {e.__class__.__name__}: {e}")
+            if not paths or not paths.get("driver_path"):
+                # Let Selenium resolve per launch as it would without the cache, don't retry every launch
+                self.unresolved.add(name)
+                return None
+
+            entry = {}
+            for kind in ("driver", "browser"):
+                path = paths.get(f"{kind}_path") or None
+                entry[f"{kind}_path"] = path
+                entry[f"{kind}_mtime"] = stamp(path)
+                entry[f"{kind}_version"] = binary_version(path)
+            self.entries[name] = entry
+            self.save()
+            print(f"[INFO] Resolved {name}: driver {entry['driver_version']}, browser {entry['browser_version']}")
+            return entry
+
+    def template(self, browser, prefs):
+        """Template profile directory for these prefs, built on first use"""
+        name = cache_name(browser)
+        digest = hashlib.sha1(json.dumps(prefs, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        path = os.path.join(self.path, "profiles", f"{name}-{digest}")
+        if os.path.isdir(path):
+            return path
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f"{name}-", dir=os.path.dirname(path))
+        try:
+            PROFILE_WRITERS[name](os.path.join(staging, "profile"), prefs)
+            os.replace(os.path.join(staging, "profile"), path)
+        except OSError:
+            # Another worker published the same template first
+            if not os.path.isdir(path):
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return path
+
+    def profile(self, browser, prefs):
+        """Fresh copy of the template profile for one launch, see release_with()"""
+        copy = tempfile.mkdtemp(prefix=f"{cache_name(browser)}-profile-")
+        shutil.copytree(self.template(browser, prefs), copy, dirs_exist_ok=True)
+        return copy
+
+    @staticmethod
+    def release_with(driver, profile):
+        """Remove the profile copy when the driver quits; a driver that never quits releases it when collected or at exit"""
+        release = weakref.finalize(driver, shutil.rmtree, profile, True)
+        quit_driver = driver.quit
+
+        def quit():
+            try:
+                return quit_driver()
+            finally:
+                release()
+
+        driver.quit = quit
+        return driver
+
+    def clear(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.entries = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve browser drivers and build template profiles ahead of a run")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm_parser = commands.add_parser("warm", help="Resolve drivers and build the default template profiles")
+    warm_parser.add_argument("--browser", nargs="+", default=["chrome", "firefox"])
+    commands.add_parser("show", help="Print the resolved drivers as JSON")
+    commands.add_parser("clear", help="Delete the cache directory")
+    args = parser.parse_args()
+
+    cache = DriverCache(args.cache_dir)
+    if args.command == "warm":
+        from utils.driver_factory import profile_prefs
+        for browser in args.browser:
+            cache.resolve(browser)
+            for fast in (False, True):
+                cache.template(browser, profile_prefs(browser, fast))
+        print(json.dumps(cache.entries, indent=2, sort_keys=True))
+    elif args.command == "show":
+        print(json.dumps(cache.load(), indent=2, sort_keys=True))
+    else:
+        cache.clear()
+        print(f"[INFO] Removed {args.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
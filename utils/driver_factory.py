@@ -0,0 +1,176 @@
+import os
+from utils.lazy import ChromeOptions, ChromeService, FirefoxOptions, FirefoxService, webdriver
+
+# --fast: requests nobody asserts on
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*backtrace.io*",
+]
+ANALYTICS_HOSTS = ["*google-analytics.com", "*googletagmanager.com", "*doubleclick.net", "*backtrace.io"]
+
+CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+}
+FIREFOX_PREFS = {
+    "dom.disable_beforeunload": True,
+    "dom.disable_open_during_load": False,
+}
+FIREFOX_FAST_PREFS = {
+    "permissions.default.image": 2,
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "network.proxy.type": 2,
+    "media.autoplay.default": 5,
+    "app.update.auto": False,
+    "extensions.update.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+
+# Set by conftest from --driver-cache (utils/driver_cache.DriverCache); None resolves on every launch
+driver_cache = None
+
+
+def is_ci():
+    return bool(os.getenv("CI") or os.getenv("GITHUB_ACTIONS"))
+
+
+def analytics_pac():
+    """Proxy auto-config sending analytics hosts to a closed port - Firefox has no request blocking pref"""
+    checks = " || ".join(f"shExpMatch(host, '{host}')" for host in ANALYTICS_HOSTS)
+    return (
+        "data:text/plain,function FindProxyForURL(url, host) {"
+        f" if ({checks}) return 'PROXY 127.0.0.1:9'; return 'DIRECT'; }}"
+    )
+
+
+def profile_prefs(browser, fast=False):
+    """Preferences of the browser profile; the Chrome --fast profile is all command line switches"""
+    if browser.lower() != "firefox":
+        return dict(CHROME_PREFS)
+    prefs = dict(FIREFOX_PREFS)
+    if fast:
+        prefs.update(FIREFOX_FAST_PREFS)
+        prefs["network.proxy.autoconfig_url"] = analytics_pac()
+    return prefs
+
+
+def cached_binaries(browser):
+    """Resolved {driver_path, browser_path, ...} from the driver cache, None without one"""
+    return driver_cache.resolve(browser) if driver_cache else None
+
+
+def create_driver(browser, fast=False):
+    """
+    Launch a new Chrome/Chromium or Firefox WebDriver session.
+
+    fast=True runs headless with page_load_strategy "eager", blocks images,
+    fonts and analytics, and turns off browser features the tests don't use.
+    """
+    ci = is_ci()
+    print(f"\n Starting {browser.upper()} browser (CI: {ci}, fast: {fast})")
+
+    if browser.lower() == "firefox":
+        options = FirefoxOptions()
+        prefs = profile_prefs(browser, fast)
+        profile = driver_cache.profile(browser, prefs) if driver_cache else None
+        if profile:
+            # geckodriver runs Firefox in this directory instead of building and uploading a profile
+            options.add_argument("-profile")
+            options.add_argument(profile)
+        else:
+            for name, value in prefs.items():
+                options.set_preference(name, value)
+
+        if ci or fast:
+            options.add_argument("--headless")
+
+        if fast:
+            options.page_load_strategy = "eager"
+            options.add_argument("--width=1920")
+            options.add_argument("--height=1080")
+
+        service = None
+        binaries = cached_binaries(browser)
+        if binaries:
+            service = FirefoxService(executable_path=binaries["driver_path"])
+            if binaries["browser_path"]:
+                options.binary_location = binaries["browser_path"]
+
+        driver = webdriver.Firefox(options=options, service=service)
+        return driver_cache.release_with(driver, profile) if profile else driver
+
+    options = ChromeOptions()
+
+    # Basic settings
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-infobars")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--window-size=1920,1080")
+
+    if fast:
+        options.page_load_strategy = "eager"
+        if not ci:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--mute-audio")
+        options.add_argument("--no-first-run")
+
+    # CI-only settings (Chromium)
+    if ci:
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+
+        #  Set Chromium binary location
+        options.binary_location = "/usr/bin/chromium-browser"
+
+        #  Use Service instead of executable_path
+        service = ChromeService(executable_path="/usr/lib/chromium-browser/chromedriver")
+        driver = webdriver.Chrome(service=service, options=options)
+
+    else:
+        profile = driver_cache.profile(browser, profile_prefs(browser)) if driver_cache else None
+        if profile:
+            options.add_argument(f"--user-data-dir={profile}")
+        else:
+            options.add_experimental_option("prefs", profile_prefs(browser))
+
+        service = None
+        binaries = cached_binaries(browser)
+        if binaries:
+            service = ChromeService(executable_path=binaries["driver_path"])
+            if binaries["browser_path"]:
+                options.binary_location = binaries["browser_path"]
+
+        driver = webdriver.Chrome(options=options, service=service)
+        if profile:
+            driver_cache.release_with(driver, profile)
+
+    if fast:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+    return driver
+
+
+def attach_driver(debugger_address):
+    """New WebDriver session on an already running Chrome/Chromium, e.g. host.capabilities debuggerAddress"""
+    options = ChromeOptions()
+    options.debugger_address = debugger_address
+
+    if is_ci():
+        service = ChromeService(executable_path="/usr/lib/chromium-browser/chromedriver")
+        return webdriver.Chrome(service=service, options=options)
+    binaries = cached_binaries("chrome")
+    service = ChromeService(executable_path=binaries["driver_path"]) if binaries else None
+    return webdriver.Chrome(service=service, options=options)
@@ -0,0 +1,88 @@
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from utils.lazy import By
+from utils.waits import wait_for_presence
+
+
+class DriverPool:
+    """
+    Keeps warm browsers per browser type (and --fast profile) so tests don't pay for a launch each.
+
+    A driver is reset when it is released (alerts dismissed, extra windows
+    closed, cookies/localStorage/sessionStorage cleared, back on the base URL).
+    If the reset fails the browser is considered dead and is quit; the next
+    acquire() then falls back to a fresh launch.
+    """
+
+    def __init__(self, factory, base_url, size=1):
+        self.factory = factory
+        self.base_url = base_url
+        self.size = size
+        self.idle = {}
+        self.launches = 0
+        self.reuses = 0
+
+    def acquire(self, browser, fast=False):
+        idle = self.idle.get((browser, fast), [])
+        if idle:
+            self.reuses += 1
+            return idle.pop()
+
+        self.launches += 1
+        driver = self.factory(browser, fast=fast)
+        driver.get(self.base_url)
+        self.wait_for_login_page(driver)
+        return driver
+
+    def release(self, driver, browser, fast=False):
+        idle = self.idle.setdefault((browser, fast), [])
+        if len(idle) >= self.size or not self.reset(driver):
+            self.discard(driver)
+            return
+        idle.append(driver)
+
+    def reset(self, driver):
+        """Bring a used browser back to a clean login page, False if it is unusable"""
+        try:
+            self.dismiss_alerts(driver)
+            self.close_extra_windows(driver)
+
+            # Storage can only be cleared for the origin that is currently loaded
+            driver.get(self.base_url)
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.get(self.base_url)
+
+            self.wait_for_login_page(driver)
+            return True
+        except WebDriverException as e:
+            print(f"[INFO] Browser reset failed, relaunching: {e.__class__.__name__}")
+            return False
+
+    def wait_for_login_page(self, driver, timeout=10):
+        wait_for_presence(driver, (By.ID, "login-button"), timeout)
+
+    def dismiss_alerts(self, driver):
+        while True:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                return
+
+    def close_extra_windows(self, driver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    def discard(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        for drivers in self.idle.values():
+            for driver in drivers:
+                self.discard(driver)
+        self.idle.clear()
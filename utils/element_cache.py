@@ -0,0 +1,85 @@
+NAVIGATION_METHODS = ("get", "back", "forward", "refresh")
+
+
+def track_navigation(driver):
+    """
+    Count get/back/forward/refresh calls in driver.navigations, so caches can
+    tell the page was replaced. Patches the innermost driver once; an
+    EventFiringWebDriver forwards its navigation calls to it.
+    """
+    driver = getattr(driver, "wrapped_driver", driver)
+    if isinstance(getattr(driver, "navigations", None), int):
+        return driver
+
+    driver.navigations = 0
+    for name in NAVIGATION_METHODS:
+        def navigate(*args, _original=getattr(driver, name), **kwargs):
+            driver.navigations += 1
+            return _original(*args, **kwargs)
+        setattr(driver, name, navigate)
+    return driver
+
+
+class ElementCache:
+    """
+    find_elements() results of one page object, keyed by locator.
+
+    Page objects invalidate it when they navigate or change the DOM, and drop
+    a locator whenever one of its elements raises StaleElementReferenceException.
+    Navigation through the driver itself (get, back, forward, refresh, also
+    from tests) clears it on the next lookup. Empty results are never cached,
+    the page may not have rendered yet. Hit/miss counters are kept per cache
+    and for the whole process, plugins/element_cache.py reports them.
+    """
+
+    total_hits = 0
+    total_misses = 0
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.tracked = track_navigation(driver)
+        self.navigation = self.tracked.navigations
+        self.elements = {}
+        self.hits = 0
+        self.misses = 0
+
+    def current(self):
+        """Drop every entry if the driver navigated since they were found"""
+        if self.tracked.navigations != self.navigation:
+            self.navigation = self.tracked.navigations
+            self.elements.clear()
+
+    def __contains__(self, locator):
+        self.current()
+        return locator in self.elements
+
+    def get(self, locator):
+        self.current()
+        if locator in self.elements:
+            self.hits += 1
+            ElementCache.total_hits += 1
+            return self.elements[locator]
+
+        return self.put(locator, self.driver.find_elements(*locator))
+
+    def put(self, locator, elements):
+        self.current()
+        self.misses += 1
+        ElementCache.total_misses += 1
+        elements = list(elements)
+        if elements:
+            self.elements[locator] = elements
+        return elements
+
+    def invalidate(self, locator=None):
+        if locator is None:
+            self.elements.clear()
+        else:
+            self.elements.pop(locator, None)
+
+    @classmethod
+    def totals(cls):
+        return {"hits": cls.total_hits, "misses": cls.total_misses}
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.elements)}
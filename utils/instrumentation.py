@@ -0,0 +1,125 @@
+import json
+import statistics
+import sys
+import time
+from selenium.webdriver.support.events import AbstractEventListener, EventFiringWebDriver
+from utils.stats import percentile
+
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+def calling_page_method():
+    """'CartPage.click_checkout' for the outermost page-object method on the stack, else '<test>'"""
+    from pages.base_page import BasePage
+
+    tag = "<test>"
+    frame = sys._getframe(2)
+    while frame:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, BasePage):
+            tag = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return tag
+
+
+class ActionTimings:
+    """
+    Wall time of every find_element, click, send_keys, get and execute_script,
+    tagged with the page-object method that issued it and the test nodeid.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.nodeid = None
+
+    def wrap(self, driver, nodeid):
+        self.nodeid = nodeid
+        return EventFiringWebDriver(driver, TimingListener(self))
+
+    def add(self, action, seconds, method):
+        self.records.append((self.nodeid, method, action, seconds))
+
+    def histogram(self, nodeid=None):
+        """{method: {action: {count, total_ms, p50_ms, p95_ms, max_ms, buckets}}}"""
+        samples = {}
+        for record_nodeid, method, action, seconds in self.records:
+            if nodeid is None or record_nodeid == nodeid:
+                samples.setdefault(method, {}).setdefault(action, []).append(seconds * 1000)
+
+        result = {}
+        for method, actions in samples.items():
+            for action, values in actions.items():
+                buckets = {f"<={limit}ms": 0 for limit in BUCKETS_MS}
+                buckets[f">{BUCKETS_MS[-1]}ms"] = 0
+                for value in values:
+                    limit = next((l for l in BUCKETS_MS if value <= l), None)
+                    buckets[f"<={limit}ms" if limit else f">{BUCKETS_MS[-1]}ms"] += 1
+                result.setdefault(method, {})[action] = {
+                    "count": len(values),
+                    "total_ms": round(sum(values), 2),
+                    "p50_ms": round(statistics.median(values), 2),
+                    "p95_ms": round(percentile(values, 95), 2),
+                    "max_ms": round(max(values), 2),
+                    "buckets": buckets,
+                }
+        return result
+
+    def method_totals(self):
+        totals = {}
+        for _, method, _, seconds in self.records:
+            totals[method] = totals.get(method, 0.0) + seconds
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+    def export(self, path):
+        with open(path, "w") as f:
+            json.dump(self.histogram(), f, indent=2, sort_keys=True)
+
+
+class TimingListener(AbstractEventListener):
+    """Times the dispatch pairs of EventFiringWebDriver (before_x / after_x)"""
+
+    def __init__(self, timings):
+        self.timings = timings
+        self.started = []
+
+    def start(self):
+        self.started.append((time.perf_counter(), calling_page_method()))
+
+    def stop(self, action):
+        if self.started:
+            started, method = self.started.pop()
+            self.timings.add(action, time.perf_counter() - started, method)
+
+    def before_find(self, by, value, driver):
+        self.start()
+
+    def after_find(self, by, value, driver):
+        self.stop("find_element")
+
+    def before_click(self, element, driver):
+        self.start()
+
+    def after_click(self, element, driver):
+        self.stop("click")
+
+    def before_change_value_of(self, element, driver):
+        self.start()
+
+    def after_change_value_of(self, element, driver):
+        self.stop("send_keys")
+
+    def before_navigate_to(self, url, driver):
+        self.start()
+
+    def after_navigate_to(self, url, driver):
+        self.stop("get")
+
+    def before_execute_script(self, script, driver):
+        self.start()
+
+    def after_execute_script(self, script, driver):
+        self.stop("execute_script")
+
+    def on_exception(self, exception, driver):
+        # Failed calls (e.g. find_element polled by a wait) are still time spent
+        self.stop("failed")
@@ -0,0 +1,54 @@
+"""
+Selenium (and Allure) names that are only imported when they are first used.
+
+Importing anything under selenium.webdriver runs selenium/webdriver/__init__.py,
+which loads the options, services and remote drivers of every browser. Page
+objects, waits and the driver factory take By, EC, WebDriverWait and the
+browser classes from here instead, so collecting tests (and booting xdist
+workers) doesn't pay for Selenium until a test actually builds a driver.
+Exceptions come from selenium.common.exceptions, which is cheap and needed
+at import time for except clauses. The plugins take `allure` from here too,
+so only a run that attaches something imports it.
+"""
+import importlib
+
+
+class LazyImport:
+    """Stands in for a module, or one attribute of it, and imports it on first use"""
+
+    def __init__(self, module, attribute=None):
+        self._module = module
+        self._attribute = attribute
+        self._target = None
+
+    def resolve(self):
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            self._target = getattr(target, self._attribute) if self._attribute else target
+        return self._target
+
+    def __getattr__(self, name):
+        # Tools probe module globals for private markers (pytest's fixture
+        # collection asks every one for _pytestfixturefunction); those must not
+        # import the module. Nothing in this repo uses a private name through a proxy.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        name = f"{self._module}.{self._attribute}" if self._attribute else self._module
+        return f"<lazy {name}{'' if self._target is None else ' (loaded)'}>"
+
+
+webdriver = LazyImport("selenium.webdriver")
+By = LazyImport("selenium.webdriver.common.by", "By")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+ChromeOptions = LazyImport("selenium.webdriver.chrome.options", "Options")
+ChromeService = LazyImport("selenium.webdriver.chrome.service", "Service")
+FirefoxOptions = LazyImport("selenium.webdriver.firefox.options", "Options")
+FirefoxService = LazyImport("selenium.webdriver.firefox.service", "Service")
+allure = LazyImport("allure")
@@ -0,0 +1,122 @@
+"""
+Declarative test matrices: dimensions in, parametrized cases out.
+
+    Matrix(user=by_key(users, "username"), driver=["chrome", "firefox"], product=by_key(products, "name"))
+
+A dimension is a dict {id: value}, a list of plain values (id = str(value))
+or a list of pytest.param(value, id=..., marks=...). cases() is a generator:
+"all" yields the full cartesian product, "pairwise" a reduced set that still
+covers every pair of values of any two dimensions. Case ids join the value
+ids ("standard_user-chrome-Sauce Labs Backpack") and don't depend on the
+strategy or order of generation, so sharding by hash of the id is stable.
+"""
+import hashlib
+import itertools
+from dataclasses import dataclass
+
+
+@dataclass
+class Case:
+    id: str
+    values: dict
+    marks: tuple = ()
+
+
+def by_key(items, key, marks=None):
+    """[{key: "a", ...}, ...] -> {"a": item}; marks maps ids to a mark or tuple of marks"""
+    marks = marks or {}
+    return {
+        item[key]: _param(item, item[key], marks[item[key]]) if item[key] in marks else item
+        for item in items
+    }
+
+
+def _param(value, value_id, marks):
+    import pytest
+    return pytest.param(value, id=value_id, marks=marks)
+
+
+def entries(dimension):
+    """Normalize a dimension to [(id, value, marks)]"""
+    if isinstance(dimension, dict):
+        items = dimension.items()
+    else:
+        items = ((None, value) for value in dimension)
+
+    result = []
+    for value_id, value in items:
+        marks = ()
+        # pytest.param(...) gives a ParameterSet (values, marks, id)
+        if hasattr(value, "values") and hasattr(value, "marks") and hasattr(value, "id"):
+            value_id = value.id or value_id
+            marks = tuple(value.marks)
+            value = value.values[0]
+        result.append((str(value) if value_id is None else str(value_id), value, marks))
+    return result
+
+
+def shard_of(case_id, count):
+    return int(hashlib.sha1(case_id.encode("utf-8")).hexdigest(), 16) % count
+
+
+def pairwise_rows(sizes):
+    """
+    Index rows covering every value pair of every two dimensions (greedy, deterministic).
+    Each row starts from the smallest uncovered pair, then every other dimension
+    takes the value that covers the most still-uncovered pairs.
+    """
+    uncovered = {
+        ((i, a), (j, b))
+        for i, j in itertools.combinations(range(len(sizes)), 2)
+        for a in range(sizes[i])
+        for b in range(sizes[j])
+    }
+    while uncovered:
+        (i, a), (j, b) = min(uncovered)
+        row = {i: a, j: b}
+        for k in range(len(sizes)):
+            if k in row:
+                continue
+            row[k] = max(
+                range(sizes[k]),
+                key=lambda v: (
+                    sum(
+                        tuple(sorted(((k, v), (m, row[m])))) in uncovered
+                        for m in row
+                    ),
+                    -v
+                )
+            )
+        covered = {
+            tuple(sorted(((m, row[m]), (n, row[n]))))
+            for m, n in itertools.combinations(range(len(sizes)), 2)
+        }
+        uncovered -= covered
+        yield tuple(row[k] for k in range(len(sizes)))
+
+
+class Matrix:
+    def __init__(self, **dimensions):
+        self.names = list(dimensions)
+        self.dimensions = [entries(dimension) for dimension in dimensions.values()]
+
+    def rows(self, strategy="all"):
+        sizes = [len(dimension) for dimension in self.dimensions]
+        if strategy == "all" or len(sizes) < 2:
+            return itertools.product(*(range(size) for size in sizes))
+        if strategy == "pairwise":
+            return pairwise_rows(sizes)
+        raise ValueError(f"Unknown matrix strategy {strategy!r}, use 'all' or 'pairwise'")
+
+    def cases(self, strategy="all", shard=None):
+        """Generate Case objects; shard=(index, count) keeps only that hash shard"""
+        for row in self.rows(strategy):
+            picked = [dimension[index] for dimension, index in zip(self.dimensions, row)]
+            case_id = "-".join(value_id for value_id, _, _ in picked)
+            if shard and shard_of(case_id, shard[1]) != shard[0]:
+                continue
+            yield Case(
+                id=case_id,
+                values={name: value for name, (_, value, _) in zip(self.names, picked)},
+                marks=tuple(mark for _, _, marks in picked for mark in marks)
+            )
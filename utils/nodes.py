@@ -0,0 +1,20 @@
+"""
+Test identity shared by the plugins: node ids without their xdist group and the browser a test runs on.
+"""
+import re
+
+# "@firefox-0" appended by --browser-affinity's xdist_group
+GROUP_SUFFIX = re.compile(r"@[\w.-]+-\d+$")
+
+
+def base_nodeid(nodeid):
+    return GROUP_SUFFIX.sub("", nodeid)
+
+
+def item_browser(item):
+    if "driver" not in item.fixturenames:
+        return "nobrowser"
+    callspec = getattr(item, "callspec", None)
+    if callspec and "driver" in callspec.params:
+        return callspec.params["driver"]
+    return item.config.getoption("--browser")
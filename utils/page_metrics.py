@@ -0,0 +1,139 @@
+import statistics
+from urllib.parse import urlparse
+
+# Navigation Timing, paint and LCP of a freshly loaded document plus the
+# resource timings added since the previous sample. window.__pageMetrics marks
+# a document as already sampled, so a client-side route change only reports
+# its new resources.
+PAGE_METRICS_SCRIPT = """
+var fresh = !window.__pageMetrics;
+if (fresh) { window.__pageMetrics = {resources: 0}; }
+var state = window.__pageMetrics;
+var result = {url: window.location.href, fresh: fresh};
+
+function observed(type) {
+    // LCP is only exposed to observers; buffered entries are queued by observe()
+    try {
+        var observer = new PerformanceObserver(function () {});
+        observer.observe({type: type, buffered: true});
+        var records = observer.takeRecords();
+        observer.disconnect();
+        return records;
+    } catch (e) {
+        return [];
+    }
+}
+
+if (fresh) {
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        result.ttfb_ms = nav.responseStart - nav.startTime;
+        result.dom_content_loaded_ms = nav.domContentLoadedEventEnd - nav.startTime;
+        result.load_ms = nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null;
+    }
+    performance.getEntriesByType('paint').forEach(function (paint) {
+        result[paint.name === 'first-paint' ? 'first_paint_ms' : 'first_contentful_paint_ms'] = paint.startTime;
+    });
+    var lcp = observed('largest-contentful-paint');
+    if (lcp.length) { result.lcp_ms = lcp[lcp.length - 1].startTime; }
+}
+
+var resources = performance.getEntriesByType('resource').slice(state.resources);
+state.resources += resources.length;
+result.resource_count = resources.length;
+result.transfer_kb = resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, 0) / 1024;
+result.slowest_resource_ms = resources.reduce(function (slowest, r) { return Math.max(slowest, r.duration); }, 0);
+return result;
+"""
+
+METRICS = [
+    "transition_ms",
+    "ttfb_ms",
+    "dom_content_loaded_ms",
+    "load_ms",
+    "first_paint_ms",
+    "first_contentful_paint_ms",
+    "lcp_ms",
+    "resource_count",
+    "transfer_kb",
+    "slowest_resource_ms",
+]
+
+
+def page_name(url):
+    """'inventory.html' for https://www.saucedemo.com/inventory.html, 'login' for the root"""
+    return urlparse(url).path.rsplit("/", 1)[-1] or "login"
+
+
+class PageMetrics:
+    """
+    Browser-side timings sampled after every page-object navigation of one test.
+
+    Each sample holds the page, the user logged in at the time and the METRICS
+    the browser could report (paint and LCP only for a freshly loaded document).
+    Page objects pass their own driver, so every browser context of a test is
+    sampled separately; a navigation that names no user is attributed to the
+    last user that one of its driver's navigations named.
+    transition_ms is the wall time from the click or get() to the page being
+    ready, measured by the page object, so client-side route changes and
+    performance_glitch_user's blocked main thread are covered too.
+    """
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.users = {}
+        self.samples = []
+
+    def sample(self, driver, transition_seconds=None, user=None):
+        if user is not None:
+            self.users[driver] = user
+        data = driver.execute_script(PAGE_METRICS_SCRIPT)
+        metrics = {name: round(data[name], 2) for name in METRICS if data.get(name) is not None}
+        if transition_seconds is not None:
+            metrics["transition_ms"] = round(transition_seconds * 1000, 2)
+
+        sample = {
+            "nodeid": self.nodeid,
+            "user": self.users.get(driver),
+            "page": page_name(data["url"]),
+            "fresh": data["fresh"],
+            "metrics": metrics,
+        }
+        self.samples.append(sample)
+        return sample
+
+    def values(self, metric, page=None, user=None):
+        return [
+            sample["metrics"][metric]
+            for sample in self.samples
+            if metric in sample["metrics"]
+            and (page is None or sample["page"] == page)
+            and (user is None or sample["user"] == user)
+        ]
+
+    def median(self, metric, page=None, user=None):
+        values = self.values(metric, page, user)
+        return statistics.median(values) if values else None
+
+    def check_budget(self, page, user=None, **budgets):
+        """Violations of budgets given as metric=limit, e.g. lcp_ms=2500; [] when all are met"""
+        violations = []
+        for metric, limit in budgets.items():
+            measured = self.median(metric, page, user)
+            if measured is None:
+                violations.append(f"{page} {metric}: not measured for {user or 'any user'}")
+            elif measured > limit:
+                violations.append(f"{page} {metric}: {measured:.0f} > {limit} for {user or 'any user'}")
+        return violations
+
+    def assert_budget(self, page, user=None, **budgets):
+        violations = self.check_budget(page, user, **budgets)
+        assert not violations, "Page budget exceeded:\n  " + "\n  ".join(violations)
+
+    def slowdown(self, metric, page, user, baseline_user="standard_user"):
+        """Median of metric for user divided by the baseline user's, None if either is missing"""
+        measured = self.median(metric, page, user)
+        baseline = self.median(metric, page, baseline_user)
+        if measured is None or not baseline:
+            return None
+        return measured / baseline
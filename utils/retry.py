@@ -0,0 +1,132 @@
+import functools
+import threading
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+RETRYABLE = {"stale", "timeout"}
+# A timed-out wait already took its whole timeout, so a real failure shouldn't pay for it many times over
+MAX_TIMEOUT_RETRIES = 1
+
+# WebDriverException messages that mean the browser or driver process is gone
+CRASH_MESSAGES = (
+    "chrome not reachable",
+    "session deleted",
+    "disconnected",
+    "browsing context has been discarded",
+    "failed to decode response from marionette",
+    "tried to run command without establishing a connection",
+    "connection refused",
+    "max retries exceeded",
+)
+
+# Set by plugins/retry_report.py from --action-retries / --retry-backoff
+policy = {"attempts": 3, "backoff": 0.5}
+
+_active = threading.local()
+# Never set: backoff waits on it instead of time.sleep, which plugins/sleep_report.py counts as a fixed sleep
+_backoff = threading.Event()
+
+
+def classify(error):
+    """'stale', 'timeout', 'crash' or 'failure' (an assertion or anything else that is real)"""
+    if isinstance(error, StaleElementReferenceException):
+        return "stale"
+    if isinstance(error, TimeoutException):
+        return "timeout"
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return "crash"
+    if isinstance(error, (WebDriverException, ConnectionError)):
+        message = str(error).lower()
+        if isinstance(error, ConnectionError) or any(text in message for text in CRASH_MESSAGES):
+            return "crash"
+    return "failure"
+
+
+class RetryLog:
+    """
+    Action retries of the running test, collected by plugins/retry_report.py.
+
+    Records are kept per thread, and only on a thread that has called take():
+    the test's thread starts collecting when its test starts, while loadgen's
+    virtual-user threads never do, so they neither grow the log nor mix into
+    a test's records.
+    """
+
+    _local = threading.local()
+
+    @classmethod
+    def add(cls, action, kind, attempt, error, delay):
+        records = getattr(cls._local, "records", None)
+        if records is None:
+            return
+        lines = str(error).strip().splitlines()
+        records.append({
+            "action": action,
+            "kind": kind,
+            "attempt": attempt,
+            "error": f"{error.__class__.__name__}: {lines[0] if lines else ''}",
+            "delay_s": delay,
+        })
+
+    @classmethod
+    def take(cls):
+        """This thread's records since the last take(); from now on it records"""
+        records = getattr(cls._local, "records", None) or []
+        cls._local.records = []
+        return records
+
+
+def retry_action(func=None, done=None):
+    """
+    Retry a page-object method on stale elements, with exponential backoff.
+
+    Timeouts are only retried for actions whose effect can be confirmed
+    with done(page), and at most MAX_TIMEOUT_RETRIES times: done(page) is
+    checked first, so an action that already happened (e.g. the navigation
+    went through but the wait timed out) is not repeated. A plain wait that
+    timed out is a real failure and is raised at once, as are crashes.
+    Decorated methods don't call each other; should one do so anyway, only
+    the outermost call retries. The page's element cache is dropped before
+    every retry.
+    """
+    if func is None:
+        return functools.partial(retry_action, done=done)
+
+    @functools.wraps(func)
+    def wrapper(page, *args, **kwargs):
+        if getattr(_active, "depth", 0):
+            return func(page, *args, **kwargs)
+
+        action = f"{type(page).__name__}.{func.__name__}"
+        _active.depth = 1
+        try:
+            attempt = 1
+            timeouts = 0
+            while True:
+                try:
+                    return func(page, *args, **kwargs)
+                except Exception as e:
+                    kind = classify(e)
+                    if kind not in RETRYABLE or attempt >= policy["attempts"]:
+                        raise
+                    if kind == "timeout":
+                        timeouts += 1
+                        if done is None or timeouts > MAX_TIMEOUT_RETRIES:
+                            raise
+                    delay = policy["backoff"] * 2 ** (attempt - 1)
+                    RetryLog.add(action, kind, attempt, e, delay)
+
+                _backoff.wait(delay)
+                page.elements.invalidate()
+                if done is not None and done(page):
+                    return None
+                attempt += 1
+        finally:
+            _active.depth = 0
+
+    return wrapper
@@ -0,0 +1,129 @@
+import io
+import queue
+import threading
+
+FORMATS = {
+    "png": ("png", "image/png"),
+    "webp": ("webp", "image/webp"),
+}
+
+
+def encode(png, image_format="png", scale=1.0):
+    """PNG bytes -> (bytes, format), downscaled and/or re-encoded with Pillow when asked"""
+    if image_format == "png" and scale == 1.0:
+        return png, "png"
+    try:
+        from PIL import Image
+    except ImportError:
+        # Pillow is optional, keep the capture as it is
+        return png, "png"
+
+    image = Image.open(io.BytesIO(png))
+    if scale != 1.0:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.LANCZOS)
+    out = io.BytesIO()
+    image.save(out, format=image_format.upper())
+    return out.getvalue(), image_format
+
+
+class AllureSlot:
+    """
+    An attachment registered on the running Allure test whose body is written later.
+
+    Allure keeps the test being reported per thread, so the attachment has to
+    be registered from the test thread; only the file is written by the
+    background writer. allure-pytest has no public call that registers an
+    attachment without writing its body (allure.attach and allure.attach.file
+    write on the spot), hence the private AllureReporter._attach. allure-pytest
+    is pinned in requirements.txt for it; a reporter without _attach gets the
+    plain PNG through allure.attach on the test thread instead (see submit()).
+    """
+
+    @staticmethod
+    def supported(reporter):
+        return callable(getattr(reporter, "_attach", None))
+
+    def __init__(self, reporter, name, image_format):
+        from allure_commons.utils import uuid4
+
+        extension, mime_type = FORMATS[image_format]
+        self.file_name = reporter._attach(uuid4(), name=name, attachment_type=mime_type, extension=extension)
+
+    def write(self, body):
+        from allure_commons import plugin_manager
+
+        plugin_manager.hook.report_attached_data(body=body, file_name=self.file_name)
+
+
+class ScreenshotWriter:
+    """
+    Encodes and writes failure screenshots on a background thread.
+
+    The test thread only captures the PNG once and queues it. The queue is
+    bounded, so a run with many failures blocks on submit() instead of
+    holding every screenshot in memory. Images go to an ArtifactStore
+    (utils/artifact_store.py), so repeated identical failures are kept once.
+    flush() waits until everything queued is on disk.
+    """
+
+    def __init__(self, store, image_format="png", scale=1.0, max_pending=16):
+        self.store = store
+        self.image_format = image_format
+        self.scale = scale
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.errors = []
+        self.thread = threading.Thread(target=self.run, name="screenshot-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, png, nodeid, reporter=None, name=None):
+        """
+        Queue a capture to be stored for nodeid and, with an Allure reporter,
+        attached to the test running on this thread.
+        """
+        # The attachment type is fixed now; without Pillow it falls back to PNG
+        image_format = self.image_format if self.can_encode() else "png"
+        slot = None
+        if reporter and AllureSlot.supported(reporter):
+            try:
+                slot = AllureSlot(reporter, name, image_format)
+            except (KeyError, TypeError):
+                # No Allure test running on this thread
+                pass
+        elif reporter:
+            from utils.lazy import allure
+            allure.attach(png, name=name, attachment_type=allure.attachment_type.PNG)
+        self.queue.put((png, nodeid, image_format, slot))
+
+    def can_encode(self):
+        if self.image_format == "png" and self.scale == 1.0:
+            return True
+        try:
+            import PIL  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def run(self):
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                png, nodeid, image_format, slot = job
+                body, extension = encode(png, image_format, self.scale)
+                self.store.put(body, extension, nodeid)
+                if slot:
+                    slot.write(body)
+            except Exception as e:
+                self.errors.append(f"{e.__class__.__name__}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        self.queue.join()
+
+    def close(self):
+        self.flush()
+        self.queue.put(None)
+        self.thread.join()
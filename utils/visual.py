@@ -0,0 +1,186 @@
+"""
+Visual checks of element screenshots: perceptual hash first, pixel diff only when the hashes disagree.
+
+image_hash() is a 64-bit difference hash (dHash) of the grayscale picture
+shrunk to 9x8, so anti-aliasing, font hinting and small scaling changes
+between machines move only a few bits. When two hashes are further apart
+than HASH_THRESHOLD bits, pixel_diff() compares the actual pixels with
+NumPy before calling it a mismatch.
+
+VisualBaselines keeps one PNG per check name under its root and caches
+results per baseline (.visual_cache.json, keyed by the sha1 of the baseline
+and of the capture), so an unchanged capture costs one sha1 on later runs.
+A missing baseline is reported as "missing", which is not a pass; only
+with update=True is the capture written as the baseline ("new").
+
+Pillow and NumPy are imported on first use, so collection doesn't pay for them.
+"""
+import hashlib
+import io
+import json
+import os
+import re
+from dataclasses import dataclass
+
+HASH_SIZE = 8
+# Differing bits (of 64) that still count as the same picture
+HASH_THRESHOLD = 6
+# Per-channel difference treated as rendering noise, and the share of pixels allowed beyond it
+PIXEL_TOLERANCE = 24
+PIXEL_THRESHOLD = 0.01
+CACHE_FILE = ".visual_cache.json"
+PASSING = ("identical", "hash", "pixels", "new", "updated")
+
+
+@dataclass
+class VisualResult:
+    name: str
+    status: str
+    distance: int = None
+    diff_ratio: float = None
+
+    @property
+    def passed(self):
+        return self.status in PASSING
+
+
+def load_image(png):
+    from PIL import Image
+    return Image.open(io.BytesIO(png)).convert("RGB")
+
+
+def image_hash(png):
+    """dHash as 16 hex digits: is each pixel brighter than its left neighbour"""
+    import numpy as np
+    from PIL import Image
+
+    gray = load_image(png).convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS)
+    pixels = np.asarray(gray, dtype=np.int16)
+    return np.packbits(pixels[:, 1:] > pixels[:, :-1]).tobytes().hex()
+
+
+def hamming(first, second):
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+
+def pixel_diff(png, baseline_png):
+    """Share of pixels differing by more than PIXEL_TOLERANCE in any channel (capture resized to the baseline)"""
+    import numpy as np
+    from PIL import Image
+
+    image, baseline = load_image(png), load_image(baseline_png)
+    if image.size != baseline.size:
+        image = image.resize(baseline.size, Image.LANCZOS)
+    delta = np.abs(np.asarray(image, dtype=np.int16) - np.asarray(baseline, dtype=np.int16)).max(axis=2)
+    return float((delta > PIXEL_TOLERANCE).mean())
+
+
+def compare(png, baseline_png, name="", baseline_hash=None):
+    """VisualResult of a capture against a baseline, without any caching"""
+    if png == baseline_png:
+        return VisualResult(name, "identical", 0, 0.0)
+    distance = hamming(image_hash(png), baseline_hash or image_hash(baseline_png))
+    if distance <= HASH_THRESHOLD:
+        return VisualResult(name, "hash", distance)
+    ratio = pixel_diff(png, baseline_png)
+    return VisualResult(name, "pixels" if ratio <= PIXEL_THRESHOLD else "mismatch", distance, round(ratio, 5))
+
+
+def lookalikes(images, threshold=HASH_THRESHOLD):
+    """Names in {name: png} whose picture hashes within threshold of another one's"""
+    hashes = {name: image_hash(png) for name, png in images.items()}
+    return sorted(
+        name for name, value in hashes.items()
+        if any(other != name and hamming(value, hashes[other]) <= threshold for other in hashes)
+    )
+
+
+def sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def file_name(name):
+    """'inventory/Sauce Labs Backpack' -> 'inventory/Sauce_Labs_Backpack.png'"""
+    return "/".join(re.sub(r"[^\w.-]+", "_", part) for part in name.split("/")) + ".png"
+
+
+class VisualBaselines:
+    """Baseline PNGs under root plus the per-baseline result cache"""
+
+    def __init__(self, root, update=False):
+        self.root = root
+        self.update = update
+        self.cache_path = os.path.join(root, CACHE_FILE)
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache.setdefault("hashes", {})
+        cache.setdefault("results", {})
+        return cache
+
+    def path(self, name):
+        return os.path.join(self.root, *file_name(name).split("/"))
+
+    def baseline(self, name):
+        try:
+            with open(self.path(name), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write(self, name, png):
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+
+    def check(self, name, png):
+        baseline = self.baseline(name)
+        if baseline is None and not self.update:
+            return VisualResult(name, "missing")
+        if self.update:
+            self.write(name, png)
+            return VisualResult(name, "new" if baseline is None else "updated")
+
+        baseline_sha, capture_sha = sha1(baseline), sha1(png)
+        cached = self.cache["results"].get(baseline_sha, {}).get(capture_sha)
+        if cached:
+            return VisualResult(name, *cached)
+
+        if baseline_sha not in self.cache["hashes"]:
+            self.cache["hashes"][baseline_sha] = image_hash(baseline)
+        result = compare(png, baseline, name, self.cache["hashes"][baseline_sha])
+        self.cache["results"].setdefault(baseline_sha, {})[capture_sha] = [
+            result.status, result.distance, result.diff_ratio
+        ]
+        return result
+
+    def save(self):
+        """Merge into the cache file on disk, other xdist workers may have written it meanwhile"""
+        if not os.path.isdir(self.root):
+            return
+        merged = self.load_cache()
+        merged["hashes"].update(self.cache["hashes"])
+        for baseline_sha, results in self.cache["results"].items():
+            merged["results"].setdefault(baseline_sha, {}).update(results)
+
+        # Results of replaced baselines can never be hit again
+        live = set()
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(".png"):
+                    with open(os.path.join(directory, name), "rb") as f:
+                        live.add(sha1(f.read()))
+        for key in ("hashes", "results"):
+            merged[key] = {baseline_sha: value for baseline_sha, value in merged[key].items() if baseline_sha in live}
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(merged, f, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,63 @@
+from utils.lazy import EC, WebDriverWait
+
+DEFAULT_TIMEOUT = 10
+
+
+def wait_until(driver, condition, timeout=DEFAULT_TIMEOUT):
+    return WebDriverWait(driver, timeout).until(condition)
+
+
+def wait_for_visible(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, EC.visibility_of_element_located(locator), timeout)
+
+
+def wait_for_clickable(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, EC.element_to_be_clickable(locator), timeout)
+
+
+def wait_for_presence(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, EC.presence_of_element_located(locator), timeout)
+
+
+def wait_for_all_present(driver, locator, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, EC.presence_of_all_elements_located(locator), timeout)
+
+
+def wait_for_url_contains(driver, fragment, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, EC.url_contains(fragment), timeout)
+
+
+def wait_for_staleness(driver, element, timeout=DEFAULT_TIMEOUT):
+    """Wait until an element is detached from the DOM (removed or page navigated)"""
+    return wait_until(driver, EC.staleness_of(element), timeout)
+
+
+def wait_for_document_ready(driver, timeout=DEFAULT_TIMEOUT):
+    return wait_until(
+        driver,
+        lambda d: d.execute_script("return document.readyState") == "complete",
+        timeout
+    )
+
+
+def wait_for_count(driver, locator, count, timeout=DEFAULT_TIMEOUT):
+    return wait_until(driver, lambda d: len(d.find_elements(*locator)) == count, timeout)
+
+
+def watch_dom(driver, css_selector="body"):
+    """Start recording DOM mutations below css_selector, see wait_for_dom_mutation()"""
+    driver.execute_script(
+        """
+        window.__domMutated = false;
+        if (window.__domObserver) { window.__domObserver.disconnect(); }
+        window.__domObserver = new MutationObserver(function () { window.__domMutated = true; });
+        window.__domObserver.observe(document.querySelector(arguments[0]),
+            {childList: true, subtree: true, attributes: true, characterData: true});
+        """,
+        css_selector
+    )
+
+
+def wait_for_dom_mutation(driver, timeout=DEFAULT_TIMEOUT):
+    """Wait until the DOM changed since the last watch_dom() call"""
+    return wait_until(driver, lambda d: d.execute_script("return window.__domMutated === true"), timeout)